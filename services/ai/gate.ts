@@ -1,3 +1,4 @@
+import { LruCache } from '../../src/utils/lru';
 import { complexity_score } from './pipeline';
 
 // Define intent types
@@ -10,32 +11,81 @@ export interface GateResult {
   reason: string;
 }
 
+// Heuristic intents in priority order, with the confidence each one yields.
+const HEURISTIC_INTENTS = [
+  { intent: 'small_talk', confidence: 0.9 },
+  { intent: 'scheduling', confidence: 0.85 },
+  { intent: 'tag', confidence: 0.8 },
+  { intent: 'reflection', confidence: 0.7 },
+] as const;
+
+// One union of the per-intent keyword lists, with a named group per intent,
+// so the message is traversed once instead of once per intent.
+const HEURISTIC_PATTERN = new RegExp(
+  '\\b(?:' +
+    [
+      "(?<small_talk>hi|hello|hey|how are you|what's up|good morning|good evening)",
+      '(?<scheduling>schedule|calendar|remind|meeting|appointment|plan|todo|task)',
+      '(?<tag>tag|label|categorize|organize|sort)',
+      '(?<reflection>analyze|reflect|understand|why|how|deep|insight)',
+    ].join('|') +
+    ')\\b',
+  'g'
+);
+
+const FAST_PATH_INTENTS: ReadonlySet<IntentType> = new Set<IntentType>(['small_talk', 'scheduling', 'tag']);
+
+type HeuristicClassification = Readonly<{ intent: IntentType; confidence: number }>;
+
+// Short messages (greetings, quick scheduling asks) recur constantly, so their
+// classifications are memoized by the lowercased text. Longer messages rarely
+// repeat and are not cached.
+const CLASSIFICATION_CACHE_CAPACITY = 1024;
+const MAX_CACHED_MESSAGE_LENGTH = 256;
+const classificationCache = new LruCache<string, HeuristicClassification>(
+  CLASSIFICATION_CACHE_CAPACITY
+);
+
 // Simple heuristic-based intent classifier (placeholder for small model)
-function classifyIntentHeuristic(userMessage: string): { intent: IntentType; confidence: number } {
-  const lower = userMessage.toLowerCase();
-  
-  // Small talk patterns
-  if (lower.match(/\b(hi|hello|hey|how are you|what's up|good morning|good evening)\b/)) {
-    return { intent: 'small_talk', confidence: 0.9 };
+function classifyIntentHeuristic(userMessage: string): HeuristicClassification {
+  const lower = userMessage.trim().toLowerCase();
+  if (lower.length > MAX_CACHED_MESSAGE_LENGTH) {
+    return classifyLowercased(lower);
   }
-  
-  // Scheduling patterns
-  if (lower.match(/\b(schedule|calendar|remind|meeting|appointment|plan|todo|task)\b/)) {
-    return { intent: 'scheduling', confidence: 0.85 };
+
+  const cached = classificationCache.get(lower);
+  if (cached) {
+    return cached;
   }
-  
-  // Tag patterns
-  if (lower.match(/\b(tag|label|categorize|organize|sort)\b/)) {
-    return { intent: 'tag', confidence: 0.8 };
+  const classification = classifyLowercased(lower);
+  classificationCache.set(lower, classification);
+  return classification;
+}
+
+function classifyLowercased(lower: string): HeuristicClassification {
+  // The leftmost keyword is not necessarily the highest-priority one, so keep
+  // the best intent seen and stop early once nothing can outrank it.
+  let best = HEURISTIC_INTENTS.length;
+  HEURISTIC_PATTERN.lastIndex = 0;
+  let match = HEURISTIC_PATTERN.exec(lower);
+  while (match && best > 0) {
+    const groups = match.groups ?? {};
+    for (let i = 0; i < best; i += 1) {
+      if (groups[HEURISTIC_INTENTS[i]!.intent] !== undefined) {
+        best = i;
+        break;
+      }
+    }
+    match = best > 0 ? HEURISTIC_PATTERN.exec(lower) : null;
   }
-  
-  // Complex patterns
-  if (lower.match(/\b(analyze|reflect|understand|why|how|deep|insight)\b/)) {
-    return { intent: 'reflection', confidence: 0.7 };
+
+  const winner = HEURISTIC_INTENTS[best];
+  if (winner) {
+    return Object.freeze({ intent: winner.intent, confidence: winner.confidence });
   }
-  
+
   // Default to unknown
-  return { intent: 'unknown', confidence: 0.3 };
+  return Object.freeze({ intent: 'unknown', confidence: 0.3 });
 }
 
 // Main gating function
@@ -48,8 +98,7 @@ export async function gateRequest(input: {
     const { intent, confidence } = classifyIntentHeuristic(input.userMessage);
     
     // Check if should route to fast path
-    const fastPathIntents: IntentType[] = ['small_talk', 'scheduling', 'tag'];
-    const shouldFastPath = confidence > 0.8 && fastPathIntents.includes(intent);
+    const shouldFastPath = confidence > 0.8 && FAST_PATH_INTENTS.has(intent);
     
     const route = shouldFastPath ? 'fast_path' : 'gpt_thinking';
     const reason = shouldFastPath 
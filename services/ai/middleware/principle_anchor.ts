@@ -5,6 +5,13 @@ export interface PrincipleAnchorConfig {
 
 const DEFAULT_PRINCIPLE = 'Optimize for reconnection (clarity, continuity, coherence); avoid verbose comfort.';
 
+// Each phrase group is one case-insensitive alternation compiled at load, so
+// a check is a single scan of the response instead of one regex per phrase.
+const VERBOSE_COMFORT_PATTERN = /comfort|it's okay|don't worry|take it easy|relax/i;
+const RECONNECTION_PATTERN = /let's continue|building on|next step|moving forward|connect/i;
+// Length of the shortest verbose-comfort trigger ("relax").
+const MIN_VERBOSE_COMFORT_LENGTH = 5;
+
 export class PrincipleAnchorMiddleware {
   private config: PrincipleAnchorConfig;
   private log: any[] = [];
@@ -35,27 +42,11 @@ export class PrincipleAnchorMiddleware {
     // Analyze response content for principle alignment
     const responseText = typeof response === 'string' ? response : JSON.stringify(response);
     
-    // Check for verbose comfort patterns
-    const verbosePatterns = [
-      /comfort/i,
-      /it's okay/i,
-      /don't worry/i,
-      /take it easy/i,
-      /relax/i,
-    ];
-    
-    const hasVerboseComfort = verbosePatterns.some(pattern => pattern.test(responseText));
-    
-    // Check for reconnection patterns
-    const reconnectionPatterns = [
-      /let's continue/i,
-      /building on/i,
-      /next step/i,
-      /moving forward/i,
-      /connect/i,
-    ];
-    
-    const hasReconnection = reconnectionPatterns.some(pattern => pattern.test(responseText));
+    // Check for verbose comfort patterns, and only then for reconnection.
+    // Text shorter than the shortest trigger cannot match, so skip the scan.
+    const hasVerboseComfort =
+      responseText.length >= MIN_VERBOSE_COMFORT_LENGTH && VERBOSE_COMFORT_PATTERN.test(responseText);
+    const hasReconnection = hasVerboseComfort && RECONNECTION_PATTERN.test(responseText);
     
     // Nudge logic: if verbose comfort detected and no reconnection, suggest reconnection
     if (hasVerboseComfort && !hasReconnection) {
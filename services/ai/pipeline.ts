@@ -1,4 +1,5 @@
 import { z } from 'zod';
+import { LruCache } from '../../src/utils/lru';
 
 // Define input/output schemas for each phase
 const UnderstandInputSchema = z.object({
@@ -55,11 +56,47 @@ const ActOutputSchema = z.object({
   diagnostics: z.any().optional(),
 });
 
+// Whitespace runs, question marks, hedging words and action verbs are all
+// counted in one pass of a single alternation instead of four separate scans.
+// Tokens are whitespace runs + 1, matching the previous split(/\s+/).length.
+const COMPLEXITY_PATTERN =
+  /(?<space>\s+)|(?<question>\?)|\b(?:(?<ambiguous>or|maybe|perhaps|might|could|possibly)|(?<action>create|schedule|plan|analyze|reflect))\b/gi;
+
+// understand(), the gate fallback, self-consistency and tree-of-thoughts all
+// score the same message within one request, so scores are memoized by the
+// message text.
+const COMPLEXITY_CACHE_CAPACITY = 512;
+const complexityCache = new LruCache<string, number>(COMPLEXITY_CACHE_CAPACITY);
+
 // Complexity scoring function
 export function complexity_score(input: { userMessage: string; context?: any }): number {
-  const tokens = input.userMessage.split(/\s+/).length;
-  const ambiguity = (input.userMessage.match(/\?/g) || []).length + (input.userMessage.match(/\b(or|maybe|perhaps|might|could|possibly)\b/gi) || []).length;
-  const requiredActions = (input.userMessage.match(/\b(create|schedule|plan|analyze|reflect)\b/gi) || []).length;
+  const cached = complexityCache.get(input.userMessage);
+  if (cached !== undefined) {
+    return cached;
+  }
+  const score = scoreComplexity(input.userMessage);
+  complexityCache.set(input.userMessage, score);
+  return score;
+}
+
+function scoreComplexity(userMessage: string): number {
+  let tokens = 1;
+  let ambiguity = 0;
+  let requiredActions = 0;
+
+  COMPLEXITY_PATTERN.lastIndex = 0;
+  let match = COMPLEXITY_PATTERN.exec(userMessage);
+  while (match) {
+    const groups = match.groups ?? {};
+    if (groups.space !== undefined) {
+      tokens += 1;
+    } else if (groups.action !== undefined) {
+      requiredActions += 1;
+    } else {
+      ambiguity += 1;
+    }
+    match = COMPLEXITY_PATTERN.exec(userMessage);
+  }
 
   // Simple weighted score: tokens/100 + ambiguity*0.5 + requiredActions
   return (tokens / 100) + (ambiguity * 0.5) + requiredActions;
@@ -126,20 +163,22 @@ export async function runPipeline(input: {
   // Phase 1: Understand
   const understandResult = await understand(validatedInput);
 
+  // Stage outputs are already parsed by the stage that produced them and the
+  // context was validated above, so the next stage's input is assembled
+  // directly instead of being re-validated by another schema parse.
+
   // Phase 2: Reason
-  const reasonInput = ReasonInputSchema.parse({
+  const reasonResult = await reason({
     understandOutput: understandResult,
-    context: input.context,
+    context: validatedInput.context,
   });
-  const reasonResult = await reason(reasonInput);
 
   // Phase 3: Act
-  const actInput = ActInputSchema.parse({
+  const actResult = await act({
     reasonOutput: reasonResult,
     understandOutput: understandResult,
-    context: input.context,
+    context: validatedInput.context,
   });
-  const actResult = await act(actInput);
 
   return actResult;
 }
@@ -1,4 +1,4 @@
-import { readFileSync } from 'fs';
+import { readFileSync, statSync } from 'fs';
 import { join } from 'path';
 import { load } from 'js-yaml';
 import { z } from 'zod';
@@ -28,6 +28,25 @@ const PersonaDocumentSchema = z
   })
   .passthrough();
 
+interface CachedPersona {
+  mtimeMs: number;
+  size: number;
+  ino: number;
+  persona: Persona | null;
+}
+
+// Parsed personas are shared across router instances and only re-read when a
+// file's mtime, size or inode changes, so constructing a router costs a stat()
+// per persona file instead of a read, YAML parse and schema validation.
+const personaFileCache = new Map<string, CachedPersona>();
+
+// Intents with a dedicated persona; every other intent uses the default.
+const PERSONA_BY_INTENT: ReadonlyMap<IntentType, string> = new Map<IntentType, string>([
+  ['reflection', 'mirror'],
+  ['analysis', 'analyst'],
+  ['scheduling', 'scheduler'],
+]);
+
 export interface RouterConfig {
   personasPath: string;
   defaultPersona: string;
@@ -78,8 +97,7 @@ export class CognitionRouter {
     for (const file of personaFiles) {
       try {
         const filePath = join(this.config.personasPath, file);
-        const content = readFileSync(filePath, 'utf-8');
-        const persona = this.parseYamlPersona(filePath, content);
+        const persona = this.readPersona(filePath);
         if (persona) {
           this.personas.set(persona.name, persona);
         }
@@ -98,6 +116,28 @@ export class CognitionRouter {
     }
   }
 
+  private readPersona(filePath: string): Persona | null {
+    const stats = statSync(filePath);
+    const cached = personaFileCache.get(filePath);
+    if (
+      cached &&
+      cached.mtimeMs === stats.mtimeMs &&
+      cached.size === stats.size &&
+      cached.ino === stats.ino
+    ) {
+      return cached.persona;
+    }
+    const content = readFileSync(filePath, 'utf-8');
+    const persona = this.parseYamlPersona(filePath, content);
+    personaFileCache.set(filePath, {
+      mtimeMs: stats.mtimeMs,
+      size: stats.size,
+      ino: stats.ino,
+      persona,
+    });
+    return persona;
+  }
+
   private parseYamlPersona(filePath: string, content: string): Persona | null {
     try {
       const parsed = load(content);
@@ -119,21 +159,7 @@ export class CognitionRouter {
   }
 
   private selectPersona(intent: IntentType, context: any): Persona {
-    let requestedPersonaName: string;
-    switch (intent) {
-      case 'reflection':
-        requestedPersonaName = 'mirror';
-        break;
-      case 'analysis':
-        requestedPersonaName = 'analyst';
-        break;
-      case 'scheduling':
-        requestedPersonaName = 'scheduler';
-        break;
-      default:
-        requestedPersonaName = this.config.defaultPersona;
-        break;
-    }
+    const requestedPersonaName = PERSONA_BY_INTENT.get(intent) ?? this.config.defaultPersona;
 
     const requestedPersona = this.personas.get(requestedPersonaName);
     if (requestedPersona) {
@@ -160,12 +186,18 @@ export class CognitionRouter {
   }
 
   private composeSystemPrompt(persona: Persona, lessons: string[] = []): string {
-    const recentLessons = lessons.slice(-this.config.maxLessons);
-    
     let prompt = persona.dna;
     
-    if (recentLessons.length > 0) {
-      prompt += '\n\nRecent Lessons:\n' + recentLessons.map((lesson, i) => `${i + 1}. ${lesson}`).join('\n');
+    // Append the last maxLessons lessons in place, without slicing, mapping
+    // and joining intermediate arrays. The start index matches
+    // lessons.slice(-maxLessons), where 0 keeps them all.
+    const { maxLessons } = this.config;
+    const start = maxLessons > 0 ? Math.max(0, lessons.length - maxLessons) : Math.min(-maxLessons, lessons.length);
+    if (start < lessons.length) {
+      prompt += '\n\nRecent Lessons:';
+      for (let i = start; i < lessons.length; i++) {
+        prompt += `\n${i - start + 1}. ${lessons[i]}`;
+      }
     }
     
     // Inject principle anchor
@@ -225,35 +257,34 @@ export class CognitionRouter {
     personaName: string,
     systemPrompt: string
   ): Promise<EnhancedPipelineResult> {
-    // Check for PAL mode
-    const palResult = await palMode.executePAL(input);
-
-    // Run main pipeline
-    const pipelineResult: EnhancedPipelineResult = await runPipeline({
-      userMessage: input.userMessage,
-      context: input.context,
-    });
+    // PAL, the main pipeline, tree-of-thoughts and self-consistency do not
+    // depend on each other, so they run concurrently.
+    const [palResult, pipelineResult, totResult, scResult] = await Promise.all([
+      // Check for PAL mode
+      palMode.executePAL(input),
+      // Run main pipeline
+      runPipeline({
+        userMessage: input.userMessage,
+        context: input.context,
+      }) as Promise<EnhancedPipelineResult>,
+      // Apply advanced reasoning if needed
+      personaName === 'analyst'
+        ? treeOfThoughts.exploreThoughts(
+            systemPrompt,
+            input,
+            personaName,
+            'plan' // Assume plan schema for complex tasks
+          )
+        : Promise.resolve(null),
+      // Apply self-consistency for plans
+      selfConsistencyVoter.generateConsistentResponse(systemPrompt, 'plan', input),
+    ]);
 
-    // Apply advanced reasoning if needed
-    if (personaName === 'analyst') {
-      const totResult = await treeOfThoughts.exploreThoughts(
-        systemPrompt,
-        input,
-        personaName,
-        'plan' // Assume plan schema for complex tasks
-      );
-      if (totResult) {
-        // Integrate ToT result
-        pipelineResult.tot = totResult;
-      }
+    if (totResult) {
+      // Integrate ToT result
+      pipelineResult.tot = totResult;
     }
 
-    // Apply self-consistency for plans
-    const scResult = await selfConsistencyVoter.generateConsistentResponse(
-      systemPrompt,
-      'plan',
-      input
-    );
     if (scResult) {
       pipelineResult.selfConsistency = scResult;
     }
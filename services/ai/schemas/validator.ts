@@ -11,8 +11,23 @@ const compiledSchemas = {
   schedule: ajv.compile(scheduleSchema.schema),
 };
 
+// Pass/fail-only validators for hot loops (ToT thoughts, self-consistency
+// samples) that never read the errors: without allErrors, Ajv's generated
+// code returns at the first failing keyword instead of collecting them all.
+const quickAjv = new Ajv({ strict: true, allErrors: false });
+
+const quickSchemas = {
+  reflection: quickAjv.compile(reflectionSchema.schema),
+  plan: quickAjv.compile(planSchema.schema),
+  schedule: quickAjv.compile(scheduleSchema.schema),
+};
+
 export type SchemaType = keyof typeof compiledSchemas;
 
+export function isValidForSchema(type: SchemaType, data: any): boolean {
+  return quickSchemas[type](data) === true;
+}
+
 export interface ValidationResult {
   valid: boolean;
   errors?: string[];
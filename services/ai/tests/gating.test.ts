@@ -8,6 +8,7 @@ describe('Gating System', () => {
       { message: 'Tag this as important', expectedIntent: 'tag', expectFastPath: true },
       { message: 'Why do I feel this way?', expectedIntent: 'reflection', expectFastPath: false },
       { message: 'Analyze my spending patterns', expectedIntent: 'analysis', expectFastPath: false },
+      { message: 'Why did my meeting move?', expectedIntent: 'scheduling', expectFastPath: true },
     ];
 
     testCases.forEach(({ message, expectedIntent, expectFastPath }) => {
@@ -18,6 +19,13 @@ describe('Gating System', () => {
         expect(result.route).toBe(expectFastPath ? 'fast_path' : 'gpt_thinking');
       });
     });
+
+    test('should classify repeated messages consistently regardless of case and padding', async () => {
+      const first = await gateRequest({ userMessage: 'Remind me about the meeting' });
+      const repeated = await gateRequest({ userMessage: '  REMIND me about the MEETING ' });
+
+      expect(repeated).toEqual(first);
+    });
   });
 
   describe('Fast Path Responses', () => {
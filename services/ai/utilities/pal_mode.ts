@@ -27,19 +27,13 @@ async function runPythonSandbox(code: string, timeout: number): Promise<any> {
   throw new Error('Mock sandbox execution failed');
 }
 
+// Basic arithmetic or a numeric keyword, compiled once into one alternation
+// so detection is a single scan instead of eight separate regex tests.
+const NUMERIC_REASONING_PATTERN =
+  /\b\d+\s*[\+\-\*\/]\s*\d+\b|\b(?:calculate|compute|sum|average|total|math|equation)\b/i;
+
 function detectNumericReasoning(text: string): boolean {
-  const patterns = [
-    /\b\d+\s*[\+\-\*\/]\s*\d+\b/, // basic arithmetic
-    /\bcalculate\b/i,
-    /\bcompute\b/i,
-    /\bsum\b/i,
-    /\baverage\b/i,
-    /\btotal\b/i,
-    /\bmath\b/i,
-    /\bequation\b/i,
-  ];
-  
-  return patterns.some(pattern => pattern.test(text));
+  return NUMERIC_REASONING_PATTERN.test(text);
 }
 
 export class PALMode {
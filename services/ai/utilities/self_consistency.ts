@@ -1,5 +1,6 @@
+import { LruCache } from '../../../src/utils/lru';
 import { complexity_score } from '../pipeline';
-import { validateAgainstSchema, SchemaType } from '../schemas/validator';
+import { isValidForSchema, SchemaType } from '../schemas/validator';
 
 export interface SelfConsistencyConfig {
   enabled: boolean;
@@ -35,6 +36,39 @@ async function mockLLMCall(prompt: string, temperature: number, schema?: SchemaT
   return { mock: true };
 }
 
+// Identical (prompt, temperature, schema) calls within a short window reuse
+// one result. The promise is cached so concurrent duplicates share a single
+// in-flight call; invalid samples are cached too (they fail validation the
+// same way again), while rejected calls are evicted so they can be retried.
+const SAMPLE_CACHE_TTL_MS = 60_000;
+const SAMPLE_CACHE_CAPACITY = 2048;
+
+interface CachedSample {
+  expiresAt: number;
+  result: Promise<any>;
+}
+
+const sampleCache = new LruCache<string, CachedSample>(SAMPLE_CACHE_CAPACITY);
+
+function cachedLLMCall(prompt: string, temperature: number, schema?: SchemaType): Promise<any> {
+  const key = `${schema ?? ''}\u0000${temperature}\u0000${prompt}`;
+  const now = Date.now();
+  const cached = sampleCache.peek(key);
+  if (cached && cached.expiresAt > now) {
+    return cached.result;
+  }
+
+  const result = mockLLMCall(prompt, temperature, schema);
+  const entry: CachedSample = { expiresAt: now + SAMPLE_CACHE_TTL_MS, result };
+  sampleCache.set(key, entry);
+  result.catch(() => {
+    if (sampleCache.peek(key) === entry) {
+      sampleCache.delete(key);
+    }
+  });
+  return result;
+}
+
 export class SelfConsistencyVoter {
   private config: SelfConsistencyConfig;
 
@@ -70,18 +104,25 @@ export class SelfConsistencyVoter {
       throw new Error('No temperatures configured for self-consistency voting');
     }
 
-    for (let i = 0; i < this.config.k; i++) {
-      const index = i % this.config.temperatures.length;
-      const temp = this.config.temperatures[index]!;
-      try {
-        const sample = await mockLLMCall(prompt, temp, schema);
-        // Validate sample
-        const validation = validateAgainstSchema(schema, sample);
-        if (validation.valid) {
-          samples.push(sample as T);
+    // Samples are independent, so all k calls are in flight at once; results
+    // keep their index order, and a failed sample only drops itself.
+    const results = await Promise.all(
+      Array.from({ length: this.config.k }, async (_, i) => {
+        const index = i % this.config.temperatures.length;
+        const temp = this.config.temperatures[index]!;
+        try {
+          const sample = await cachedLLMCall(prompt, temp, schema);
+          // Validate sample
+          return isValidForSchema(schema, sample) ? (sample as T) : null;
+        } catch (error) {
+          console.warn(`[SelfConsistency] Sample ${i} failed:`, error);
+          return null;
         }
-      } catch (error) {
-        console.warn(`[SelfConsistency] Sample ${i} failed:`, error);
+      })
+    );
+    for (const sample of results) {
+      if (sample !== null) {
+        samples.push(sample);
       }
     }
 
@@ -89,9 +130,12 @@ export class SelfConsistencyVoter {
       throw new Error('No valid samples generated for self-consistency voting');
     }
 
-    // Find majority vote based on structured field agreement
-    const majorityVote = this.findMajorityVote(samples);
-    const agreementScore = this.calculateAgreementScore(samples, majorityVote);
+    // Find majority vote based on structured field agreement. Each sample is
+    // serialized once; voting and agreement then compare strings only.
+    const signatures = samples.map((sample) => JSON.stringify(sample));
+    const { index: majorityIndex, count: majorityCount } = this.findMajorityVote(signatures);
+    const majorityVote = samples[majorityIndex]!;
+    const agreementScore = majorityCount / samples.length;
 
     return {
       majorityVote,
@@ -101,29 +145,26 @@ export class SelfConsistencyVoter {
     };
   }
 
-  private findMajorityVote<T>(samples: T[]): T {
-    if (samples.length === 0) {
+  // Most common signature, ties going to the earliest sample (so all-distinct
+  // samples still yield the first one, as before).
+  private findMajorityVote(signatures: string[]): { index: number; count: number } {
+    if (signatures.length === 0) {
       throw new Error('Cannot determine majority vote from empty samples');
     }
-    // Simple majority voting - for complex objects, this would need more sophisticated logic
-    // For now, return the first sample (placeholder)
-    return samples[0]!;
-  }
-
-  private calculateAgreementScore<T>(samples: T[], majorityVote: T): number {
-    // Calculate how many samples agree with majority vote
-    let agreements = 0;
-    for (const sample of samples) {
-      if (this.samplesAgree(sample, majorityVote)) {
-        agreements++;
+    const counts = new Map<string, number>();
+    for (const signature of signatures) {
+      counts.set(signature, (counts.get(signature) ?? 0) + 1);
+    }
+    let index = 0;
+    let count = 0;
+    for (let i = 0; i < signatures.length; i++) {
+      const current = counts.get(signatures[i]!)!;
+      if (current > count) {
+        count = current;
+        index = i;
       }
     }
-    return agreements / samples.length;
-  }
-
-  private samplesAgree<T>(a: T, b: T): boolean {
-    // Simple equality check - for structured data, would compare key fields
-    return JSON.stringify(a) === JSON.stringify(b);
+    return { index, count };
   }
 }
 
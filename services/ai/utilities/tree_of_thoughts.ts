@@ -1,10 +1,13 @@
 import { complexity_score } from '../pipeline';
-import { validateAgainstSchema, SchemaType } from '../schemas/validator';
+import { isValidForSchema, SchemaType } from '../schemas/validator';
 
 export interface ToTConfig {
   enabled: boolean;
   breadth: number; // number of branches per level
   depth: number; // maximum depth
+  beamWidth: number; // children expanded per level
+  maxThoughts: number; // total thoughts generated per exploration
+  maxConcurrency: number; // thought generations in flight at once
   minComplexity: number;
   requiredPersona: string;
 }
@@ -26,14 +29,28 @@ async function mockGenerateThought(prompt: string, context: string[]): Promise<a
   return { thought: `Thought based on ${context.join(', ')}` };
 }
 
+// Per-exploration state shared by every branch: the thought budget already
+// reserved, and a small slot limiter for concurrent generation.
+interface ExplorationRun {
+  generated: number;
+  active: number;
+  waiting: Array<() => void>;
+}
+
 export class TreeOfThoughts {
   private config: ToTConfig;
+  private parents = new WeakMap<ThoughtNode, ThoughtNode>();
+  private cachedObjective: string | null = null;
+  private cachedObjectiveWords: string[] = [];
 
   constructor(config: Partial<ToTConfig> = {}) {
     this.config = {
       enabled: config.enabled ?? true,
       breadth: config.breadth ?? 3,
       depth: config.depth ?? 2,
+      beamWidth: config.beamWidth ?? 2,
+      maxThoughts: config.maxThoughts ?? 12,
+      maxConcurrency: Math.max(1, config.maxConcurrency ?? 4),
       minComplexity: config.minComplexity ?? 0.8,
       requiredPersona: config.requiredPersona ?? 'analyst',
     };
@@ -60,7 +77,7 @@ export class TreeOfThoughts {
     const shouldUse = await this.shouldUseToT(input, persona, schema);
     if (!shouldUse) return null;
 
-    console.log(`[ToT] Starting exploration with breadth=${this.config.breadth}, depth=${this.config.depth}`);
+    console.log(`[ToT] Starting exploration with breadth=${this.config.breadth}, depth=${this.config.depth}, beam=${this.config.beamWidth}`);
 
     const root: ThoughtNode = {
       id: 'root',
@@ -71,7 +88,8 @@ export class TreeOfThoughts {
       children: [],
     };
 
-    await this.exploreLevel(root, initialPrompt, schema);
+    const run: ExplorationRun = { generated: 0, active: 0, waiting: [] };
+    await this.exploreLevel(run, root, initialPrompt, schema);
 
     // Find best leaf node
     const bestLeaf = this.findBestLeaf(root);
@@ -81,62 +99,121 @@ export class TreeOfThoughts {
     return bestLeaf || null;
   }
 
-  private async exploreLevel(node: ThoughtNode, prompt: string, schema: SchemaType): Promise<void> {
+  // Slots are handed directly from a finishing generation to the next
+  // waiter, so the limit holds even when new callers arrive in between.
+  private async withGenerationSlot<T>(run: ExplorationRun, task: () => Promise<T>): Promise<T> {
+    if (run.active < this.config.maxConcurrency) {
+      run.active++;
+    } else {
+      await new Promise<void>((resolve) => run.waiting.push(resolve));
+    }
+    try {
+      return await task();
+    } finally {
+      const next = run.waiting.shift();
+      if (next) {
+        next();
+      } else {
+        run.active--;
+      }
+    }
+  }
+
+  private async exploreLevel(
+    run: ExplorationRun,
+    node: ThoughtNode,
+    prompt: string,
+    schema: SchemaType
+  ): Promise<void> {
     if (node.depth >= this.config.depth) return;
 
-    // Generate breadth number of thoughts
-    for (let i = 0; i < this.config.breadth; i++) {
-      try {
-        const context = this.buildContextFromPath(node);
-        const thought = await mockGenerateThought(prompt, context);
-        
-        // Validate thought
-        const validation = validateAgainstSchema(schema, thought);
-        const score = this.scoreThought(thought, validation.valid, prompt);
-        
-        const childNode: ThoughtNode = {
-          id: `${node.id}-${i}`,
-          content: thought,
-          parentId: node.id,
-          depth: node.depth + 1,
-          score,
-          valid: validation.valid,
-          children: [],
-        };
-        
-        node.children.push(childNode);
-        
-        // Recursively explore if valid and high-scoring
-        if (validation.valid && score > 0.7) {
-          await this.exploreLevel(childNode, prompt, schema);
+    // Every sibling shares the same ancestry, so the path context is
+    // serialized once per level rather than once per generated thought.
+    let context: string[];
+    try {
+      context = this.buildContextFromPath(node);
+    } catch (error) {
+      console.warn(`[ToT] Failed to build context at depth ${node.depth}:`, error);
+      return;
+    }
+
+    // Reserve this level's share of the budget up front (synchronously, so
+    // concurrently expanding branches can never overspend it).
+    const count = Math.min(this.config.breadth, this.config.maxThoughts - run.generated);
+    if (count <= 0) return;
+    run.generated += count;
+
+    // Generate this level's thoughts concurrently, within the slot limit
+    const candidates = await Promise.all(
+      Array.from({ length: count }, async (_, i) => {
+        try {
+          const thought = await this.withGenerationSlot(run, () => mockGenerateThought(prompt, context));
+          
+          // Validate thought
+          const valid = isValidForSchema(schema, thought);
+          const score = this.scoreThought(thought, valid, prompt);
+          
+          const childNode: ThoughtNode = {
+            id: `${node.id}-${i}`,
+            content: thought,
+            parentId: node.id,
+            depth: node.depth + 1,
+            score,
+            valid,
+            children: [],
+          };
+          return childNode;
+        } catch (error) {
+          console.warn(`[ToT] Failed to generate thought ${i} at depth ${node.depth}:`, error);
+          return null;
         }
-      } catch (error) {
-        console.warn(`[ToT] Failed to generate thought ${i} at depth ${node.depth}:`, error);
+      })
+    );
+
+    for (const childNode of candidates) {
+      if (childNode) {
+        node.children.push(childNode);
+        this.parents.set(childNode, node);
       }
     }
+
+    // Beam search: only the best beamWidth valid, high-scoring children are
+    // expanded; the rest stay as leaves so findBestLeaf still considers them.
+    const beam = node.children
+      .filter((child) => child.valid && child.score > 0.7)
+      .sort((a, b) => b.score - a.score)
+      .slice(0, this.config.beamWidth);
+
+    // Beam children expand concurrently, so deeper levels start as soon as
+    // their parent level is scored instead of waiting on sibling subtrees.
+    await Promise.all(beam.map((childNode) => this.exploreLevel(run, childNode, prompt, schema)));
   }
 
+  // Ancestors are followed through parent links recorded at creation time,
+  // so building a path's context is O(depth) rather than a tree search per
+  // step. Links live in a WeakMap so nodes stay acyclic for JSON diagnostics.
   private buildContextFromPath(node: ThoughtNode): string[] {
     const context: string[] = [];
     let current: ThoughtNode | undefined = node;
     
     while (current) {
       if (current.content && typeof current.content === 'object') {
-        context.unshift(JSON.stringify(current.content));
+        context.push(JSON.stringify(current.content));
       }
-      current = current.parentId ? this.findNodeById(current.parentId, node) : undefined;
+      current = this.parents.get(current);
     }
     
-    return context;
+    return context.reverse();
   }
 
-  private findNodeById(id: string, root: ThoughtNode): ThoughtNode | undefined {
-    if (root.id === id) return root;
-    for (const child of root.children) {
-      const found = this.findNodeById(id, child);
-      if (found) return found;
+  // Every thought in a run is scored against the same prompt, so its
+  // lowercased words are split once and reused until the objective changes.
+  private objectiveWordsFor(objective: string): string[] {
+    if (this.cachedObjective !== objective) {
+      this.cachedObjective = objective;
+      this.cachedObjectiveWords = objective.toLowerCase().split(/\s+/);
     }
-    return undefined;
+    return this.cachedObjectiveWords;
   }
 
   private scoreThought(thought: any, isValid: boolean, objective: string): number {
@@ -147,30 +224,37 @@ export class TreeOfThoughts {
     
     // Objective coverage (50% weight) - placeholder logic
     const thoughtStr = JSON.stringify(thought).toLowerCase();
-    const objectiveWords = objective.toLowerCase().split(/\s+/);
-    const coverage = objectiveWords.filter(word => thoughtStr.includes(word)).length / objectiveWords.length;
-    score += coverage * 0.5;
+    const objectiveWords = this.objectiveWordsFor(objective);
+    let covered = 0;
+    for (const word of objectiveWords) {
+      if (thoughtStr.includes(word)) covered++;
+    }
+    score += (covered / objectiveWords.length) * 0.5;
     
     return Math.min(score, 1);
   }
 
+  // One iterative pre-order walk that tracks the best leaf as it goes, with
+  // no intermediate leaves array. Children are pushed in reverse so ties
+  // still resolve to the first leaf in tree order.
   private findBestLeaf(root: ThoughtNode): ThoughtNode | null {
-    const leaves: ThoughtNode[] = [];
+    const stack: ThoughtNode[] = [root];
+    let best: ThoughtNode | null = null;
     
-    function collectLeaves(node: ThoughtNode) {
+    while (stack.length > 0) {
+      const node = stack.pop()!;
       if (node.children.length === 0) {
-        leaves.push(node);
+        if (!best || node.score > best.score) {
+          best = node;
+        }
       } else {
-        node.children.forEach(collectLeaves);
+        for (let i = node.children.length - 1; i >= 0; i--) {
+          stack.push(node.children[i]!);
+        }
       }
     }
     
-    collectLeaves(root);
-    
-    // Return highest scoring leaf
-    return leaves.reduce((best, current) => 
-      current.score > best.score ? current : best
-    );
+    return best;
   }
 }
 
@@ -1,5 +1,7 @@
+import { z } from 'zod';
 import type { PlannerResponse } from '@/agent/types';
-import { persistScheduleBlock } from '@/services/schedules';
+import { DEFAULT_BLOCK_INTENT, persistScheduleBlock } from '@/services/schedules';
+import type { ScheduleBlockInput } from '@/services/schedules';
 
 export interface ToolExecutionContext {
   originalText: string;
@@ -10,17 +12,41 @@ export interface ToolExecutionResult {
   payload: Record<string, unknown>;
 }
 
-const getStartTime = (payload: Record<string, unknown>): string | null => {
-  if (typeof payload.start === 'string') return payload.start;
-  if (typeof payload.start_at === 'string') return payload.start_at;
-  return null;
-};
-
-const getEndTime = (payload: Record<string, unknown>): string | null => {
-  if (typeof payload.end === 'string') return payload.end;
-  if (typeof payload.end_at === 'string') return payload.end_at;
-  return null;
-};
+const looseString = z.string().nullable().catch(null);
+const looseRecord = z.record(z.unknown()).catch(() => ({}));
+
+// Single validation pass over planner output: wrong-typed fields degrade to
+// their defaults instead of failing the whole payload.
+const ScheduleToolPayloadSchema = z
+  .object({
+    start: looseString,
+    start_at: looseString,
+    end: looseString,
+    end_at: looseString,
+    intent: looseString,
+    goal_id: looseString,
+    summary: looseString,
+    location: looseString,
+    attendees: z
+      .array(z.unknown())
+      .catch(() => [])
+      .transform((items) =>
+        items.filter((attendee): attendee is string => typeof attendee === 'string')
+      ),
+    receipts: looseRecord,
+    metadata: looseRecord,
+  })
+  .transform((payload) => ({
+    start: payload.start ?? payload.start_at,
+    end: payload.end ?? payload.end_at,
+    intent: payload.intent && payload.intent.trim().length > 0 ? payload.intent : DEFAULT_BLOCK_INTENT,
+    goal_id: payload.goal_id,
+    summary: payload.summary,
+    location: payload.location,
+    attendees: payload.attendees,
+    receipts: payload.receipts,
+    metadata: payload.metadata,
+  }));
 
 export async function handleToolCall(
   plan: PlannerResponse | null,
@@ -30,15 +56,14 @@ export async function handleToolCall(
 
   if (plan.action === 'schedule.create') {
     const payload = (plan.payload ?? {}) as Record<string, unknown>;
-    const startRaw = getStartTime(payload);
-    const endRaw = getEndTime(payload);
+    const { start, end, ...rest } = ScheduleToolPayloadSchema.parse(payload);
 
-    if (!startRaw || !endRaw) {
+    if (!start || !end) {
       throw new Error('Planner schedule payload missing start/end');
     }
 
-    const startDate = new Date(startRaw);
-    const endDate = new Date(endRaw);
+    const startDate = new Date(start);
+    const endDate = new Date(end);
 
     if (Number.isNaN(startDate.getTime()) || Number.isNaN(endDate.getTime())) {
       throw new Error('Invalid date format for start or end time');
@@ -48,33 +73,7 @@ export async function handleToolCall(
       throw new Error('Schedule start time must be before end time');
     }
 
-    const start = startRaw;
-    const end = endRaw;
-
-    const receipts: Record<string, unknown> =
-      payload.receipts && typeof payload.receipts === 'object'
-        ? (payload.receipts as Record<string, unknown>)
-        : {};
-    const metadata: Record<string, unknown> =
-      payload.metadata && typeof payload.metadata === 'object'
-        ? (payload.metadata as Record<string, unknown>)
-        : {};
-
-    const blockInput = {
-      start,
-      end,
-      intent: typeof payload.intent === 'string' && payload.intent.trim().length > 0
-        ? payload.intent
-        : 'focus.block',
-      goal_id: typeof payload.goal_id === 'string' ? payload.goal_id : null,
-      summary: typeof payload.summary === 'string' ? payload.summary : null,
-      location: typeof payload.location === 'string' ? payload.location : null,
-      attendees: Array.isArray(payload.attendees)
-        ? payload.attendees.filter((attendee: unknown): attendee is string => typeof attendee === 'string')
-        : [],
-      receipts,
-      metadata,
-    };
+    const blockInput: ScheduleBlockInput = { start, end, ...rest };
 
     const persisted = await persistScheduleBlock(null, blockInput);
 
@@ -1,26 +1,64 @@
 import AsyncStorage from "@react-native-async-storage/async-storage";
+import { LruCache } from "@/utils/lru";
 
 interface CacheEntry<T> {
-  value: T;
-  expiresAt: number;
+  readonly value: T;
+  readonly expiresAt: number;
 }
 
 const STORAGE_PREFIX = "riflett_cache:";
+const MEMORY_CAPACITY = 64;
 
+// In-memory LRU in front of AsyncStorage.
+const memory = new LruCache<string, CacheEntry<unknown>>(MEMORY_CAPACITY);
+
+const rememberEntry = (key: string, entry: CacheEntry<unknown>): void => {
+  memory.set(key, entry);
+};
+
+// 32-bit DJB-style hash; Math.imul keeps every step in int32 space so the
+// engine never falls back to double arithmetic. Output matches the previous
+// shift/subtract form, so persisted keys remain valid.
 const hashString = (input: string): string => {
   let hash = 0;
-  for (let i = 0; i < input.length; i += 1) {
-    hash = (hash << 5) - hash + input.charCodeAt(i);
-    hash |= 0;
+  for (let i = 0, length = input.length; i < length; i += 1) {
+    hash = (Math.imul(hash, 31) + input.charCodeAt(i)) | 0;
   }
   return `${hash >>> 0}`;
 };
 
+// Fixed-width digest for large raw keys (e.g. serialized planner payloads).
+// Callers digest once and pass the short result to get/set, so the payload is
+// scanned a single time per request instead of once per cache call. Two
+// independently seeded 32-bit lanes (cyrb53) give a 53-bit value.
+export const digestKey = (input: string): string => {
+  let h1 = 0xdeadbeef;
+  let h2 = 0x41c6ce57;
+  for (let i = 0, length = input.length; i < length; i += 1) {
+    const ch = input.charCodeAt(i);
+    h1 = Math.imul(h1 ^ ch, 2654435761);
+    h2 = Math.imul(h2 ^ ch, 1597334677);
+  }
+  h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507);
+  h1 ^= Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+  h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507);
+  h2 ^= Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+  return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(16);
+};
+
 const buildKey = (raw: string): string => `${STORAGE_PREFIX}${hashString(raw)}`;
 
 export const EdgeCache = {
   async get<T>(rawKey: string): Promise<T | null> {
     const key = buildKey(rawKey);
+    const now = Date.now();
+    const hot = memory.get(key);
+    if (hot) {
+      if (hot.expiresAt >= now) {
+        return (hot.value as T) ?? null;
+      }
+      memory.delete(key);
+    }
     try {
       const stored = await AsyncStorage.getItem(key);
       if (!stored) return null;
@@ -35,10 +73,11 @@ export const EdgeCache = {
         return null;
       }
 
-      if ((parsed as CacheEntry<T>).expiresAt < Date.now()) {
+      if ((parsed as CacheEntry<T>).expiresAt < now) {
         await AsyncStorage.removeItem(key);
         return null;
       }
+      rememberEntry(key, parsed as CacheEntry<unknown>);
       return (parsed as CacheEntry<T>).value ?? null;
     } catch (error) {
       console.warn("[cache] get failed", error);
@@ -46,14 +85,24 @@ export const EdgeCache = {
     }
   },
 
-  async set<T>(rawKey: string, value: T, ttlMs: number): Promise<void> {
+  /**
+   * `serializedValue`, when given, must be the JSON text of `value` (e.g. the
+   * raw string it was parsed from); it is spliced into the stored entry so the
+   * value is not stringified a second time.
+   */
+  async set<T>(rawKey: string, value: T, ttlMs: number, serializedValue?: string): Promise<void> {
     const key = buildKey(rawKey);
     const entry: CacheEntry<T> = {
       value,
       expiresAt: Date.now() + ttlMs,
     };
+    rememberEntry(key, entry);
+    const stored =
+      serializedValue !== undefined
+        ? `{"value":${serializedValue},"expiresAt":${entry.expiresAt}}`
+        : JSON.stringify(entry);
     try {
-      await AsyncStorage.setItem(key, JSON.stringify(entry));
+      await AsyncStorage.setItem(key, stored);
     } catch (error) {
       console.warn("[cache] set failed", error);
     }
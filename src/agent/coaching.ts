@@ -8,9 +8,19 @@ export interface CoachingSuggestion {
   context?: string;
 }
 
-const DEPRESSION_INDICATORS = ['sad', 'depressed', 'anxious', 'overwhelmed', 'lonely', 'hopeless'];
-const POSITIVE_PATTERNS = ['grateful', 'accomplished', 'happy', 'progress', 'motivated'];
-const GOAL_STUCK_INDICATORS = ['stuck', 'blocked', 'frustrated', 'struggling'];
+const DEPRESSION_INDICATORS = ['sad', 'depressed', 'anxious', 'overwhelmed', 'lonely', 'hopeless'] as const;
+const POSITIVE_PATTERNS = ['grateful', 'accomplished', 'happy', 'progress', 'motivated'] as const;
+const GOAL_STUCK_INDICATORS = ['stuck', 'blocked', 'frustrated', 'struggling'] as const;
+
+// Each list is compiled once into a single case-insensitive alternation, so a
+// check is one regex scan rather than one includes() pass per word. No word
+// boundaries: matching stays substring-based, as before.
+const toAlternation = (words: readonly string[]): RegExp =>
+  new RegExp(words.map((word) => word.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|'), 'i');
+
+const NEGATIVE_PATTERN = toAlternation(DEPRESSION_INDICATORS);
+const POSITIVE_PATTERN = toAlternation(POSITIVE_PATTERNS);
+const STUCK_PATTERN = toAlternation(GOAL_STUCK_INDICATORS);
 
 export function assessUserState(
   text: string,
@@ -22,9 +32,8 @@ export function assessUserState(
   let needsCoaching = false;
 
   // Analyze current text
-  const lowerText = text.toLowerCase();
-  const hasNegative = DEPRESSION_INDICATORS.some(word => lowerText.includes(word));
-  const hasPositive = POSITIVE_PATTERNS.some(word => lowerText.includes(word));
+  const hasNegative = NEGATIVE_PATTERN.test(text);
+  const hasPositive = POSITIVE_PATTERN.test(text);
 
   if (hasNegative) {
     mood = 'negative';
@@ -46,7 +55,7 @@ export function assessUserState(
     needsCoaching = true;
   }
 
-  const hasStuckLanguage = GOAL_STUCK_INDICATORS.some(word => lowerText.includes(word));
+  const hasStuckLanguage = STUCK_PATTERN.test(text);
   if (hasStuckLanguage && operatingPicture.top_goals.length > 0) {
     reasons.push('goals feeling stuck');
     needsCoaching = true;
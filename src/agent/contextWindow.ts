@@ -4,6 +4,13 @@ const MAX_SEMANTIC_TURNS = 10;
 const DECAY_FACTOR = 0.6;
 const MIN_ACTIVE_SCORE = 0.2;
 
+// Window timestamps are only compared with each other, so a monotonic clock
+// keeps ordering and decay stable across wall-clock adjustments.
+const nowMs: () => number =
+  typeof performance !== 'undefined' && typeof performance.now === 'function'
+    ? () => Math.floor(performance.now())
+    : () => Date.now();
+
 interface WindowState {
   entryId: string;
   entryType: EntryType | 'unknown';
@@ -11,58 +18,64 @@ interface WindowState {
   decayScore: number;
 }
 
+// Messages are immutable once recorded; every instance is created from the
+// same literal shape in recordUserMessage.
 interface RecentMessage {
-  text: string;
-  ts: number;
-  score: number;
-  isReceipt: boolean;
+  readonly text: string;
+  readonly ts: number;
+  readonly score: number;
+  readonly isReceipt: boolean;
 }
 
 let state: WindowState | null = null;
 const recentMessages: RecentMessage[] = [];
-
-const computeMessageScore = (text: string): number => {
-  const trimmed = text.trim().toLowerCase();
-  if (!trimmed) return 0;
-  const tokens = trimmed.split(/[^a-z0-9]+/i).filter(Boolean);
-  if (!tokens.length) return 0;
-  const uniqueTokens = new Set(tokens);
-  const avgLength = tokens.reduce((sum, token) => sum + token.length, 0) / tokens.length;
-  const base = Math.min(1, tokens.length / 12);
+// Bumped on every mutation so derived results (e.g. intent classification)
+// can be cached against the window contents without hashing them.
+let windowVersion = 0;
+
+// Input is lowercased before scanning, so no case-insensitive flag is needed.
+const TOKEN_PATTERN = /[a-z0-9]+/g;
+
+// Both helpers take text that recordUserMessage has already trimmed and
+// lowercased once.
+const computeMessageScore = (normalized: string): number => {
+  if (!normalized) return 0;
+  // Walk matches in place rather than materialising a token array.
+  let tokenCount = 0;
+  let totalLength = 0;
+  TOKEN_PATTERN.lastIndex = 0;
+  let match = TOKEN_PATTERN.exec(normalized);
+  while (match) {
+    tokenCount += 1;
+    totalLength += match[0].length;
+    match = TOKEN_PATTERN.exec(normalized);
+  }
+  if (!tokenCount) return 0;
+  const avgLength = totalLength / tokenCount;
+  const base = Math.min(1, tokenCount / 12);
   const lexical = Math.min(1, avgLength / 5);
   return Math.min(1, base * 0.6 + lexical * 0.4);
 };
 
-const isReceiptMessage = (text: string): boolean => {
-  const lowered = text.toLowerCase();
-  return lowered.includes('receipt') || lowered.includes('confirmed');
-};
+const RECEIPT_PATTERN = /receipt|confirmed/;
 
-const pruneLowSignalMessages = () => {
-  recentMessages.sort((a, b) => b.ts - a.ts);
-  const preserved: RecentMessage[] = [];
-  for (const message of recentMessages) {
-    if (message.isReceipt) {
-      preserved.push(message);
-      continue;
-    }
-    if (preserved.length < MAX_SEMANTIC_TURNS) {
-      preserved.push(message);
-    }
-  }
-  preserved.sort((a, b) => a.ts - b.ts);
-  while (preserved.length > MAX_SEMANTIC_TURNS) {
-    preserved.shift();
+const isReceiptMessage = (normalized: string): boolean => RECEIPT_PATTERN.test(normalized);
+
+// Messages arrive in timestamp order, so the window is simply the newest
+// MAX_SEMANTIC_TURNS entries; evict from the head instead of re-sorting.
+const appendRecentMessage = (message: RecentMessage) => {
+  recentMessages.push(message);
+  if (recentMessages.length > MAX_SEMANTIC_TURNS) {
+    recentMessages.splice(0, recentMessages.length - MAX_SEMANTIC_TURNS);
   }
-  recentMessages.length = 0;
-  recentMessages.push(...preserved);
 };
 
 const applyDecay = (createdEntry: boolean) => {
   if (!state) return;
+  windowVersion += 1;
   if (createdEntry) {
     state.decayScore = 1;
-    state.createdAt = Date.now();
+    state.createdAt = nowMs();
     return;
   }
   state.decayScore *= DECAY_FACTOR;
@@ -74,6 +87,7 @@ const applyDecay = (createdEntry: boolean) => {
 export interface ContextSnapshot {
   entryId: string;
   entryType: EntryType | 'unknown';
+  /** Monotonic milliseconds; comparable only with other window timestamps. */
   createdAt: number;
   decayScore: number;
   isActive: boolean;
@@ -81,25 +95,28 @@ export interface ContextSnapshot {
 
 export const ContextWindow = {
   registerEntry(entryId: string, entryType: EntryType | 'unknown' = 'unknown') {
+    windowVersion += 1;
     state = {
       entryId,
       entryType,
-      createdAt: Date.now(),
+      createdAt: nowMs(),
       decayScore: 1,
     };
   },
 
   refreshEntry(entryId: string, entryType: EntryType | 'unknown' = 'unknown') {
     const effectiveType = entryType !== 'unknown' ? entryType : state?.entryType ?? 'unknown';
+    windowVersion += 1;
     state = {
       entryId,
       entryType: effectiveType,
-      createdAt: Date.now(),
+      createdAt: nowMs(),
       decayScore: 1,
     };
   },
 
   clear() {
+    windowVersion += 1;
     state = null;
     recentMessages.length = 0;
   },
@@ -118,16 +135,17 @@ export const ContextWindow = {
 
   recordUserMessage(text: string) {
     if (!text) return;
-    const score = computeMessageScore(text);
-    const receipt = isReceiptMessage(text);
+    const normalized = text.trim().toLowerCase();
+    const score = computeMessageScore(normalized);
+    const receipt = isReceiptMessage(normalized);
     const message: RecentMessage = {
       text,
-      ts: Date.now(),
+      ts: nowMs(),
       score: receipt ? 1 : score,
       isReceipt: receipt,
     };
-    recentMessages.push(message);
-    pruneLowSignalMessages();
+    appendRecentMessage(message);
+    windowVersion += 1;
     if (state) {
       state.decayScore = Math.min(1, state.decayScore * DECAY_FACTOR + message.score * 0.5);
       if (state.decayScore < MIN_ACTIVE_SCORE && !receipt) {
@@ -136,6 +154,10 @@ export const ContextWindow = {
     }
   },
 
+  version(): number {
+    return windowVersion;
+  },
+
   recent(): RecentMessage[] {
     return recentMessages.slice(-MAX_SEMANTIC_TURNS);
   },
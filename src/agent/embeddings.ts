@@ -1,8 +1,10 @@
 import { NativeModules } from 'react-native';
+import { LruCache } from '@/utils/lru';
 
 const { RiflettEmbeddingModule } = NativeModules as {
   RiflettEmbeddingModule?: {
     embed(text: string): Promise<number[]>;
+    embedBatch?(texts: string[]): Promise<number[][]>;
     dim?: number;
   };
 };
@@ -11,50 +13,139 @@ const FALLBACK_DIMENSION = 384;
 
 const textEncoder = typeof TextEncoder !== 'undefined' ? new TextEncoder() : null;
 
-const l2Normalize = (vector: number[]): number[] => {
-  const norm = Math.sqrt(vector.reduce((sum, val) => sum + val * val, 0));
+const l2Normalize = (vector: ArrayLike<number>): number[] => {
+  const length = vector.length;
+  let sumSquares = 0;
+  for (let i = 0; i < length; i += 1) {
+    const val = vector[i]!;
+    sumSquares += val * val;
+  }
+  const norm = Math.sqrt(sumSquares);
+  const output = new Array<number>(length);
   if (!Number.isFinite(norm) || norm <= 0) {
-    return vector.map(() => 0);
+    return output.fill(0);
+  }
+  for (let i = 0; i < length; i += 1) {
+    output[i] = vector[i]! / norm;
   }
-  return vector.map((val) => val / norm);
+  return output;
+};
+
+const encodeBytes = (text: string): Uint8Array => {
+  if (textEncoder) {
+    return textEncoder.encode(text);
+  }
+  const chars = Array.from(text);
+  const bytes = new Uint8Array(chars.length);
+  for (let i = 0; i < chars.length; i += 1) {
+    bytes[i] = chars[i]!.charCodeAt(0) & 0xff;
+  }
+  return bytes;
 };
 
 const fallbackEmbed = (text: string): number[] => {
   const dim = FALLBACK_DIMENSION;
-  const output = new Array(dim).fill(0);
-  const bytes = textEncoder
-    ? textEncoder.encode(text)
-    : Array.from(text).map((ch) => ch.charCodeAt(0) & 0xff);
+  // Typed accumulator keeps the scatter-add in a single contiguous buffer.
+  const output = new Float64Array(dim);
+  const bytes = encodeBytes(text);
 
   const prime = 16777619;
   let hash = 2166136261;
 
-  bytes.forEach((byte, index) => {
+  for (let index = 0; index < bytes.length; index += 1) {
+    const byte = bytes[index]!;
     hash = (hash ^ byte) * prime;
     const idx = Math.abs(hash + index * 31) % dim;
     output[idx] += (byte / 255) * 2 - 1;
-  });
+  }
 
   return l2Normalize(output);
 };
 
+// Process-wide LRU shared by every caller (RAG snippets recur across
+// searchTopN and getBrief). Keyed by the text itself: Map already hashes
+// string keys, so a SHA-256 digest would only add an async crypto call.
+// Vectors from a failed native call are not cached, so a transient error
+// does not pin the fallback embedding.
+const EMBEDDING_CACHE_CAPACITY = 4096;
+const embeddingCache = new LruCache<string, number[]>(EMBEDDING_CACHE_CAPACITY);
+
+const readCachedEmbedding = (text: string): number[] | undefined =>
+  embeddingCache.get(text)?.slice();
+
+const rememberEmbedding = (text: string, vector: number[]): number[] => {
+  embeddingCache.set(text, vector.slice());
+  return vector;
+};
+
+const toNumbers = (vector: unknown[]): number[] =>
+  vector.map((v) => (typeof v === 'number' ? v : Number(v)));
+
 export async function embedText(text: string): Promise<number[]> {
   if (!text) {
     return new Array(RiflettEmbeddingModule?.dim ?? FALLBACK_DIMENSION).fill(0);
   }
 
+  const cached = readCachedEmbedding(text);
+  if (cached) {
+    return cached;
+  }
+
   if (RiflettEmbeddingModule && typeof RiflettEmbeddingModule.embed === 'function') {
     try {
       const vector = await RiflettEmbeddingModule.embed(text);
       if (Array.isArray(vector) && vector.length > 0) {
-        return l2Normalize(vector.map((v) => (typeof v === 'number' ? v : Number(v))));
+        return rememberEmbedding(text, l2Normalize(toNumbers(vector)));
       }
     } catch (error) {
       console.warn('[embeddings] native embed failed, using fallback', error);
     }
+    return fallbackEmbed(text);
+  }
+
+  return rememberEmbedding(text, fallbackEmbed(text));
+}
+
+// Embeds several texts in one native call when the module supports it, so a
+// RAG page costs a single bridge roundtrip instead of one per snippet. Only
+// cache misses are sent to the module. Output order matches `texts`; any
+// vector the batch call cannot supply falls back to embedText for that item,
+// so the result always has one vector per text and the call never rejects.
+export async function embedTextBatch(texts: string[]): Promise<number[][]> {
+  if (!texts.length) {
+    return [];
+  }
+
+  const results: Array<number[] | undefined> = texts.map((text) =>
+    text ? readCachedEmbedding(text) : undefined
+  );
+  const missIndexes: number[] = [];
+  texts.forEach((text, index) => {
+    if (text && !results[index]) missIndexes.push(index);
+  });
+
+  if (
+    missIndexes.length &&
+    RiflettEmbeddingModule &&
+    typeof RiflettEmbeddingModule.embedBatch === 'function'
+  ) {
+    try {
+      const misses = missIndexes.map((index) => texts[index]!);
+      const vectors = await RiflettEmbeddingModule.embedBatch(misses);
+      if (Array.isArray(vectors) && vectors.length === misses.length) {
+        vectors.forEach((vector, position) => {
+          if (Array.isArray(vector) && vector.length > 0) {
+            const index = missIndexes[position]!;
+            results[index] = rememberEmbedding(texts[index]!, l2Normalize(toNumbers(vector)));
+          }
+        });
+      }
+    } catch (error) {
+      console.warn('[embeddings] native batch embed failed, embedding individually', error);
+    }
   }
 
-  return fallbackEmbed(text);
+  return Promise.all(texts.map((text, index) => results[index] ?? embedText(text)));
 }
 
 export { l2Normalize };
@@ -17,29 +17,28 @@ const clamp = (value: number): number => {
   return value;
 };
 
+const byConfidenceDesc = (a: ScoredLabel, b: ScoredLabel): number =>
+  b.confidence - a.confidence;
+
 const normalizeTopK = (
   nativeTopK: ScoredLabel[] | undefined
 ): ScoredLabel[] => {
   if (!Array.isArray(nativeTopK)) return [];
   const seen = new Set<string>();
-  return nativeTopK
-    .filter((item): item is ScoredLabel =>
-      Boolean(
-        item &&
-          typeof item.label === "string" &&
-          typeof item.confidence === "number"
-      )
-    )
-    .map((item) => ({
-      label: item.label,
-      confidence: clamp(item.confidence),
-    }))
-    .filter((item) => {
-      if (seen.has(item.label)) return false;
-      seen.add(item.label);
-      return true;
-    })
-    .sort((a, b) => b.confidence - a.confidence);
+  const normalized: ScoredLabel[] = [];
+  for (const item of nativeTopK) {
+    if (
+      !item ||
+      typeof item.label !== "string" ||
+      typeof item.confidence !== "number" ||
+      seen.has(item.label)
+    ) {
+      continue;
+    }
+    seen.add(item.label);
+    normalized.push({ label: item.label, confidence: clamp(item.confidence) });
+  }
+  return normalized.sort(byConfidenceDesc);
 };
 
 export function buildRoutedIntent(
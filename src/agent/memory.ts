@@ -1,5 +1,5 @@
 import AsyncStorage from '@react-native-async-storage/async-storage';
-import { embedText, l2Normalize } from '@/agent/embeddings';
+import { embedText, embedTextBatch, l2Normalize } from '@/agent/embeddings';
 import { supabase } from '@/lib/supabase';
 import { getOperatingPicture, ragSearch } from '@/services/memory';
 import type { OperatingPicture, RagResult } from '@/services/memory';
@@ -81,7 +81,113 @@ let sqliteFlavor: 'legacy' | 'modern' | null = null;
 let sqliteReady = false;
 let initialized: Promise<void> | null = null;
 
-const memoryCache = new Map<string, MemoryRow>();
+// Local memory is stored structure-of-arrays: row metadata lives in
+// `cachedRows` and every embedding lives in one contiguous row-major
+// Int8Array, so search scans a single buffer and no per-row number[] is
+// retained. Each row is quantized symmetrically against its own max
+// magnitude (value ~= q * embeddingScales[slot]), a quarter of the float32
+// footprint. Slots are kept compact (swap-remove) and rows shorter than the
+// stride are zero-padded, which leaves dot products over min(query, row)
+// length unchanged.
+type CachedRow = Omit<MemoryRow, 'embedding'>;
+
+const QUANT_LEVELS = 127;
+
+const cachedRows: CachedRow[] = [];
+const embeddingLengths: number[] = [];
+const embeddingScales: number[] = [];
+const slotById = new Map<string, number>();
+let embeddingMatrix = new Int8Array(0);
+let matrixStride = 0;
+
+// Without SQLite, AsyncStorage is the only durable copy, so the original
+// full-precision vectors are kept by id and persisted instead of the
+// dequantized matrix rows; quantization loss stays confined to the cache.
+// Stays empty when SQLite (which stores full-precision rows) is available.
+const fallbackEmbeddings = new Map<string, number[]>();
+
+const readEmbedding = (slot: number): number[] => {
+  const offset = slot * matrixStride;
+  const scale = embeddingScales[slot]!;
+  return Array.from(
+    embeddingMatrix.subarray(offset, offset + embeddingLengths[slot]!),
+    (q) => q * scale
+  );
+};
+
+const growMatrix = (stride: number, capacity: number) => {
+  const next = new Int8Array(stride * capacity);
+  for (let slot = 0; slot < cachedRows.length; slot += 1) {
+    const offset = slot * matrixStride;
+    next.set(embeddingMatrix.subarray(offset, offset + embeddingLengths[slot]!), slot * stride);
+  }
+  embeddingMatrix = next;
+  matrixStride = stride;
+};
+
+// Rows are built field by field rather than with spread/rest, so every cached
+// row and returned record shares one fixed shape and no intermediate copy
+// is allocated (stored JSON may also carry stray fields).
+const cacheRow = (row: MemoryRow) => {
+  const embedding = row.embedding;
+  const meta: CachedRow = { id: row.id, kind: row.kind, text: row.text, ts: row.ts };
+  let slot = slotById.get(row.id);
+  if (slot === undefined) {
+    slot = cachedRows.length;
+    slotById.set(row.id, slot);
+    embeddingLengths[slot] = 0;
+    embeddingScales[slot] = 0;
+  }
+  cachedRows[slot] = meta;
+
+  const capacity = matrixStride > 0 ? embeddingMatrix.length / matrixStride : 0;
+  if (embedding.length > matrixStride || cachedRows.length > capacity) {
+    growMatrix(
+      Math.max(matrixStride, embedding.length),
+      Math.max(16, capacity * 2, cachedRows.length)
+    );
+  }
+
+  let maxAbs = 0;
+  for (const value of embedding) {
+    const magnitude = Math.abs(value);
+    if (magnitude > maxAbs) maxAbs = magnitude;
+  }
+  const offset = slot * matrixStride;
+  embeddingMatrix.fill(0, offset, offset + matrixStride);
+  if (maxAbs > 0 && Number.isFinite(maxAbs)) {
+    const factor = QUANT_LEVELS / maxAbs;
+    for (let i = 0; i < embedding.length; i += 1) {
+      embeddingMatrix[offset + i] = Math.round(embedding[i]! * factor);
+    }
+    embeddingScales[slot] = maxAbs / QUANT_LEVELS;
+  } else {
+    embeddingScales[slot] = 0;
+  }
+  embeddingLengths[slot] = embedding.length;
+};
+
+const evictRow = (id: string) => {
+  fallbackEmbeddings.delete(id);
+  const slot = slotById.get(id);
+  if (slot === undefined) return;
+  slotById.delete(id);
+  const lastSlot = cachedRows.length - 1;
+  const last = cachedRows.pop()!;
+  const lastLength = embeddingLengths.pop()!;
+  const lastScale = embeddingScales.pop()!;
+  if (slot !== lastSlot) {
+    cachedRows[slot] = last;
+    embeddingLengths[slot] = lastLength;
+    embeddingScales[slot] = lastScale;
+    slotById.set(last.id, slot);
+    embeddingMatrix.copyWithin(
+      slot * matrixStride,
+      lastSlot * matrixStride,
+      (lastSlot + 1) * matrixStride
+    );
+  }
+};
 
 interface MemoryRow {
   id: string;
@@ -106,20 +212,41 @@ const mapKindsToRag = (kinds: string[]): RagKind[] => {
   return mapped
 }
 
-const inferScopeFromIntent = (intent: RoutedIntent | null | undefined): RagScopeInput => {
-  if (!intent) return 'all'
-  const label = intent.label?.toLowerCase() ?? ''
+// One precompiled, case-insensitive scan per scope replaces lowercasing the
+// label and probing it with a separate includes() per keyword.
+const GOAL_SCOPE_PATTERN = /goal/i
+const SCHEDULE_SCOPE_PATTERN = /schedule|calendar/i
+const ENTRY_SCOPE_PATTERN = /journal|reflect/i
+
+const scopeForLabel = (label: string): RagKind[] => {
   const scopes: RagKind[] = []
-  if (label.includes('goal')) {
+  if (GOAL_SCOPE_PATTERN.test(label)) {
     scopes.push('goal')
   }
-  if (label.includes('schedule') || label.includes('calendar')) {
+  if (SCHEDULE_SCOPE_PATTERN.test(label)) {
     scopes.push('schedule')
   }
-  if (scopes.length === 0 || label.includes('journal') || label.includes('reflect')) {
+  if (scopes.length === 0 || ENTRY_SCOPE_PATTERN.test(label)) {
     scopes.push('entry')
   }
-  return scopes.length ? scopes : 'all'
+  return scopes
+}
+
+// Intent labels come from a small fixed vocabulary, so each label's scope is
+// resolved once and served from this table afterwards; only a label never
+// seen before runs the keyword patterns. Entries are frozen because the same
+// array is handed to every caller.
+const scopeByLabel = new Map<string, readonly RagKind[]>()
+
+const inferScopeFromIntent = (intent: RoutedIntent | null | undefined): RagScopeInput => {
+  if (!intent) return 'all'
+  const label = intent.label ?? ''
+  let scopes = scopeByLabel.get(label)
+  if (!scopes) {
+    scopes = Object.freeze(scopeForLabel(label))
+    scopeByLabel.set(label, scopes)
+  }
+  return scopes.length ? (scopes as RagKind[]) : 'all'
 }
 
 export type MemoryKind = 'entry' | 'goal' | 'event' | 'pref' | 'schedule';
@@ -136,6 +263,12 @@ interface SearchOptions {
   topK: number;
 }
 
+interface BatchSearchOptions {
+  queries: string[];
+  kinds: string[];
+  topK: number;
+}
+
 interface UpsertOptions {
   id: string;
   kind: MemoryKind;
@@ -287,7 +420,7 @@ const tryInitSqlite = async (): Promise<boolean> => {
           ts: row.ts,
           embedding: parseEmbedding(row.embedding),
         };
-        memoryCache.set(parsed.id, parsed);
+        cacheRow(parsed);
       });
     }
 
@@ -337,11 +470,16 @@ const hydrateFromStorage = async (): Promise<void> => {
     if (!raw) return;
     const parsed = JSON.parse(raw) as MemoryRow[];
     parsed.forEach((row) => {
-      memoryCache.set(row.id, {
-        ...row,
-        embedding: Array.isArray(row.embedding)
-          ? l2Normalize(row.embedding.map((v) => Number(v)))
-          : [],
+      const embedding = Array.isArray(row.embedding)
+        ? l2Normalize(row.embedding.map((v) => Number(v)))
+        : [];
+      fallbackEmbeddings.set(row.id, embedding);
+      cacheRow({
+        id: row.id,
+        kind: row.kind,
+        text: row.text,
+        ts: row.ts,
+        embedding,
       });
     });
   } catch (error) {
@@ -349,14 +487,30 @@ const hydrateFromStorage = async (): Promise<void> => {
   }
 };
 
+// Without SQLite the cache is the store, capped at MAX_CACHED_ROWS. Only an
+// overflowing write has anything to evict, and finding its oldest row is a
+// linear scan, so no write re-sorts the whole cache.
+const evictOverflow = () => {
+  while (cachedRows.length > MAX_CACHED_ROWS) {
+    let oldest = 0;
+    for (let slot = 1; slot < cachedRows.length; slot += 1) {
+      if (cachedRows[slot]!.ts < cachedRows[oldest]!.ts) {
+        oldest = slot;
+      }
+    }
+    evictRow(cachedRows[oldest]!.id);
+  }
+};
+
 const persistFallback = async (): Promise<void> => {
-  const subset = Array.from(memoryCache.values())
-    .sort((a, b) => b.ts - a.ts)
-    .slice(0, MAX_CACHED_ROWS)
-    .map((row) => ({
-      ...row,
-      embedding: row.embedding,
-    }));
+  evictOverflow();
+  const subset = cachedRows.map((row, slot): MemoryRow => ({
+    id: row.id,
+    kind: row.kind,
+    text: row.text,
+    ts: row.ts,
+    embedding: fallbackEmbeddings.get(row.id) ?? readEmbedding(slot),
+  }));
   try {
     await AsyncStorage.setItem(STORAGE_KEY, JSON.stringify(subset));
   } catch (error) {
@@ -364,109 +518,243 @@ const persistFallback = async (): Promise<void> => {
   }
 };
 
-const cosineScores = (query: number[], rows: MemoryRow[]): MemoryRecord[] => {
-  const normalizedQuery = l2Normalize(query);
-  const scores = rows.map((row) => {
-    const embedding = row.embedding;
-    const length = Math.min(normalizedQuery.length, embedding.length);
-    let dot = 0;
-    for (let i = 0; i < length; i += 1) {
-      dot += normalizedQuery[i]! * embedding[i]!;
+// Dot product of `query` against one quantized matrix row, before the row
+// scale is applied. JS has no portable SIMD, so
+// the loop is unrolled four wide with independent accumulators, which lets
+// the JIT pipeline the multiplies instead of serialising on a single sum.
+const dotRow = (query: Float32Array, offset: number, length: number): number => {
+  let s0 = 0;
+  let s1 = 0;
+  let s2 = 0;
+  let s3 = 0;
+  let i = 0;
+  const unrolled = length - (length % 4);
+  for (; i < unrolled; i += 4) {
+    s0 += query[i]! * embeddingMatrix[offset + i]!;
+    s1 += query[i + 1]! * embeddingMatrix[offset + i + 1]!;
+    s2 += query[i + 2]! * embeddingMatrix[offset + i + 2]!;
+    s3 += query[i + 3]! * embeddingMatrix[offset + i + 3]!;
+  }
+  for (; i < length; i += 1) {
+    s0 += query[i]! * embeddingMatrix[offset + i]!;
+  }
+  return s0 + s1 + s2 + s3;
+};
+
+// Keeps only the best `topK` rows in a small sorted buffer (k <= 20), so a
+// scan is O(n * k) instead of sorting every candidate. Equal scores prefer
+// the newer row, matching the ts-descending order local rows used to be
+// read in. `normalizedQuery` comes straight from embedText, which already
+// L2-normalizes; embeddings are only copied out for the rows returned.
+// Search stays exact and flat on purpose: selectLocalSlots and the fallback
+// eviction both bound a scan to MAX_CACHED_ROWS, where one pass over the
+// int8 matrix is cheaper than maintaining an ANN graph on every write. An
+// approximate index only pays off if that ceiling is lifted well past ~1k.
+const scoreSlots = (
+  normalizedQuery: number[],
+  slots: number[],
+  topK: number
+): MemoryRecord[] => {
+  if (!slots.length) return [];
+  const length = Math.min(normalizedQuery.length, matrixStride);
+  // The query stays full precision (asymmetric quantization); only stored
+  // rows are int8, so a single row scale recovers the cosine.
+  const query = Float32Array.from(normalizedQuery.slice(0, length));
+  const top: Array<{ slot: number; ts: number; score: number }> = [];
+  for (const slot of slots) {
+    const dot = dotRow(query, slot * matrixStride, length) * embeddingScales[slot]!;
+    const row = cachedRows[slot]!;
+    const floor = top[top.length - 1];
+    if (
+      top.length >= topK &&
+      floor &&
+      (dot < floor.score || (dot === floor.score && row.ts <= floor.ts))
+    ) {
+      continue;
     }
+    let position = top.length;
+    while (position > 0) {
+      const prev = top[position - 1]!;
+      if (prev.score > dot || (prev.score === dot && prev.ts >= row.ts)) break;
+      position -= 1;
+    }
+    top.splice(position, 0, { slot, ts: row.ts, score: dot });
+    if (top.length > topK) {
+      top.pop();
+    }
+  }
+  return top.map(({ slot, score }) => {
+    const row = cachedRows[slot]!;
     return {
-      ...row,
-      score: dot,
+      id: row.id,
+      kind: row.kind,
+      text: row.text,
+      ts: row.ts,
+      embedding: readEmbedding(slot),
+      score,
     };
   });
+};
+
+const writeRow = async (row: MemoryRow): Promise<void> => {
+  cacheRow(row);
+
+  if (sqliteReady && sqliteDb) {
+    await executeSql(
+      'REPLACE INTO memory (id, kind, text, ts, embedding) VALUES (?, ?, ?, ?, ?)',
+      [row.id, row.kind, row.text, row.ts, serializeEmbedding(row.embedding)]
+    );
+  } else {
+    fallbackEmbeddings.set(row.id, row.embedding);
+    await persistFallback();
+  }
+};
+
+const searchRemote = async (
+  userId: string,
+  query: string,
+  kinds: string[],
+  topK: number
+): Promise<MemoryRecord[] | null> => {
+  try {
+    const scopeKinds = mapKindsToRag(kinds);
+    const ragScope = scopeKinds.length ? scopeKinds : 'all';
+    const ragResults = await ragSearch(userId, query, ragScope, { limit: topK });
+    if (!ragResults.length) {
+      return null;
+    }
+    const nowTs = Date.now();
+    const remoteRecords: MemoryRecord[] = [];
+    const texts = ragResults.map((result) => result.snippet ?? '');
+    // One batched embed per RAG page.
+    const embeddings = await embedTextBatch(texts);
+    for (const [index, result] of ragResults.entries()) {
+      const record: MemoryRecord = {
+        id: `${result.kind}:${result.id}`,
+        kind: (result.kind as MemoryKind) ?? 'entry',
+        text: texts[index]!,
+        ts: nowTs - index,
+        embedding: embeddings[index]!,
+        score: result.score,
+      };
+      remoteRecords.push(record);
+      try {
+        await writeRow({
+          id: record.id,
+          kind: record.kind,
+          text: record.text,
+          ts: record.ts,
+          embedding: record.embedding,
+        });
+      } catch (error) {
+        console.warn('[memory] remote cache upsert failed', error);
+      }
+    }
+    return remoteRecords.slice(0, topK);
+  } catch (error) {
+    console.warn('[memory] remote search failed, falling back', error);
+    return null;
+  }
+};
 
-  return scores.sort((a, b) => b.score - a.score);
+// The local cache mirrors the SQLite table (hydrated at init, written through
+// on upsert/remove), so local candidates come from the in-memory matrix. The
+// SQLite flavour keeps its previous query semantics: default kind 'entry'
+// and only the 512 newest matching rows.
+const selectLocalSlots = (kinds: string[]): number[] => {
+  const useSqliteScope = sqliteReady && sqliteDb;
+  const filter = useSqliteScope && !kinds.length ? ['entry'] : kinds;
+  const slots: number[] = [];
+  if (!filter.length) {
+    for (let slot = 0; slot < cachedRows.length; slot += 1) {
+      slots.push(slot);
+    }
+  } else {
+    // Row kinds come from a handful of distinct strings, so each raw kind is
+    // lowercased and looked up in the filter set once per call, not per row.
+    const allowed = new Set(filter);
+    const keepByKind = new Map<string, boolean>();
+    for (let slot = 0; slot < cachedRows.length; slot += 1) {
+      const kind = cachedRows[slot]!.kind;
+      let keep = keepByKind.get(kind);
+      if (keep === undefined) {
+        keep = allowed.has(kind.toLowerCase());
+        keepByKind.set(kind, keep);
+      }
+      if (keep) {
+        slots.push(slot);
+      }
+    }
+  }
+  if (useSqliteScope && slots.length > MAX_CACHED_ROWS) {
+    return slots
+      .sort((a, b) => cachedRows[b]!.ts - cachedRows[a]!.ts)
+      .slice(0, MAX_CACHED_ROWS);
+  }
+  return slots;
 };
 
+const clampTopK = (topK: number): number => Math.max(1, Math.min(topK || 5, 20));
+
 export const Memory = {
   async searchTopN(options: SearchOptions): Promise<MemoryRecord[]> {
     await ensureInitialized();
-    const topK = Math.max(1, Math.min(options.topK || 5, 20));
+    const topK = clampTopK(options.topK);
     const userId = await resolveUserId();
     if (userId) {
-      try {
-        const scopeKinds = mapKindsToRag(options.kinds);
-        const ragScope = scopeKinds.length ? scopeKinds : 'all';
-        const ragResults = await ragSearch(
-          userId,
-          options.query,
-          ragScope,
-          { limit: topK }
-        );
-        if (ragResults.length) {
-          const nowTs = Date.now();
-          const remoteRecords: MemoryRecord[] = [];
-          for (const [index, result] of ragResults.entries()) {
-            const text = result.snippet ?? '';
-            let embedding: number[] = [];
-            try {
-              embedding = await embedText(text);
-            } catch (error) {
-              console.warn('[memory] embedding cache failure', error);
-            }
-            const record: MemoryRecord = {
-              id: `${result.kind}:${result.id}`,
-              kind: (result.kind as MemoryKind) ?? 'entry',
-              text,
-              ts: nowTs - index,
-              embedding,
-              score: result.score,
-            };
-            remoteRecords.push(record);
-            try {
-              await Memory.upsert({
-                id: record.id,
-                kind: record.kind,
-                text: record.text,
-                ts: record.ts,
-                embedding: record.embedding,
-              });
-            } catch (error) {
-              console.warn('[memory] remote cache upsert failed', error);
-            }
-          }
-          return remoteRecords.slice(0, topK);
-        }
-      } catch (error) {
-        console.warn('[memory] remote search failed, falling back', error);
+      const remote = await searchRemote(userId, options.query, options.kinds, topK);
+      if (remote) {
+        return remote;
       }
     }
 
     const kinds = options.kinds.map((kind) => kind.toLowerCase());
     const queryVector = await embedText(options.query);
+    return scoreSlots(queryVector, selectLocalSlots(kinds), topK);
+  },
 
-    if (sqliteReady && sqliteDb) {
-      const placeholders = kinds.length
-        ? kinds.map(() => '?').join(',')
-        : '?';
-      const params = kinds.length ? kinds : ['entry'];
-      const result = await executeSql(
-        `SELECT id, kind, text, ts, embedding FROM memory WHERE kind IN (${placeholders}) ORDER BY ts DESC LIMIT 512`,
-        params
-      );
-
-      const rows: MemoryRow[] = result && result.rows
-        ? result.rows._array.map((row: any) => ({
-            id: row.id,
-            kind: row.kind,
-            text: row.text,
-            ts: row.ts,
-            embedding: parseEmbedding(row.embedding),
-          }))
-        : [];
+  /**
+   * Batched variant of searchTopN. Duplicate queries are resolved once, and
+   * queries that fall back to the local store share one candidate scan.
+   * Results are returned in the same order as `options.queries`.
+   */
+  async searchTopNBatch(options: BatchSearchOptions): Promise<MemoryRecord[][]> {
+    await ensureInitialized();
+    const topK = clampTopK(options.topK);
+    const uniqueQueries = Array.from(new Set(options.queries));
+    const resolved = new Map<string, MemoryRecord[]>();
 
-      return cosineScores(queryVector, rows).slice(0, topK);
+    const userId = uniqueQueries.length ? await resolveUserId() : null;
+    let pending = uniqueQueries;
+    if (userId) {
+      const remote = await Promise.all(
+        uniqueQueries.map((query) => searchRemote(userId, query, options.kinds, topK))
+      );
+      pending = [];
+      uniqueQueries.forEach((query, index) => {
+        const records = remote[index];
+        if (records) {
+          resolved.set(query, records);
+        } else {
+          pending.push(query);
+        }
+      });
     }
 
-    const rows = Array.from(memoryCache.values()).filter((row) =>
-      kinds.length ? kinds.includes(row.kind.toLowerCase()) : true
-    );
+    if (pending.length) {
+      const kinds = options.kinds.map((kind) => kind.toLowerCase());
+      // One batched embed for every pending query; repeats across calls are
+      // served by the embedding LRU, so no query is embedded twice.
+      const queryVectors = await embedTextBatch(pending);
+      const slots = selectLocalSlots(kinds);
+      pending.forEach((query, index) => {
+        resolved.set(query, scoreSlots(queryVectors[index]!, slots, topK));
+      });
+    }
 
-    return cosineScores(queryVector, rows).slice(0, topK);
+    // Duplicate queries share one search but each position gets its own
+    // array, so sorting or splicing one result list cannot affect another.
+    return options.queries.map((query) => resolved.get(query)?.slice() ?? []);
   },
 
   async getBrief(
@@ -494,25 +782,20 @@ export const Memory = {
     const memoryRecords: MemoryRecord[] = [];
     const nowTs = Date.now();
 
+    const texts = ragResults.map((result) => result.snippet ?? '');
+    const embeddings = await embedTextBatch(texts);
     for (const [index, result] of ragResults.entries()) {
-      const text = result.snippet ?? '';
-      let embedding: number[] = [];
-      try {
-        embedding = await embedText(text);
-      } catch (error) {
-        console.warn('[memory] brief embedding failed', error);
-      }
       const record: MemoryRecord = {
         id: `${result.kind}:${result.id}`,
         kind: (result.kind as MemoryKind) ?? 'entry',
-        text,
+        text: texts[index]!,
         ts: nowTs - index,
-        embedding,
+        embedding: embeddings[index]!,
         score: result.score,
       };
       memoryRecords.push(record);
       try {
-        await Memory.upsert({
+        await writeRow({
           id: record.id,
           kind: record.kind,
           text: record.text,
@@ -535,31 +818,25 @@ export const Memory = {
     await ensureInitialized();
 
     const ts = options.ts ?? Date.now();
-    const embedding = options.embedding ?? (await embedText(options.text));
-    const normalized = l2Normalize(embedding);
+    // embedText already returns unit vectors; only caller-supplied
+    // embeddings need normalizing.
+    const embedding = options.embedding
+      ? l2Normalize(options.embedding)
+      : await embedText(options.text);
     const row: MemoryRow = {
       id: options.id,
       kind: options.kind,
       text: options.text,
       ts,
-      embedding: normalized,
+      embedding,
     };
 
-    memoryCache.set(row.id, row);
-
-    if (sqliteReady && sqliteDb) {
-      await executeSql(
-        'REPLACE INTO memory (id, kind, text, ts, embedding) VALUES (?, ?, ?, ?, ?)',
-        [row.id, row.kind, row.text, row.ts, serializeEmbedding(row.embedding)]
-      );
-    } else {
-      await persistFallback();
-    }
+    await writeRow(row);
   },
 
   async remove(id: string): Promise<void> {
     await ensureInitialized();
-    memoryCache.delete(id);
+    evictRow(id);
     if (sqliteReady && sqliteDb) {
       await executeSql('DELETE FROM memory WHERE id = ?', [id]);
     } else {
@@ -25,44 +25,68 @@ const loadJobs = async (): Promise<OutboxJob[]> => {
   }
 };
 
-const saveJobs = (jobs: OutboxJob[]): Promise<void> =>
-  AsyncStorage.setItem(STORAGE_KEY, JSON.stringify(jobs));
+// Jobs are held in an insertion-ordered Map hydrated once from storage, so
+// clear() is a keyed delete instead of a filter over the whole queue, and
+// list() no longer re-reads and re-parses storage.
+let jobsById: Map<string, OutboxJob> | null = null;
+let hydrating: Promise<Map<string, OutboxJob>> | null = null;
 
-let queueChain: Promise<void> = Promise.resolve();
+const getJobs = async (): Promise<Map<string, OutboxJob>> => {
+  if (jobsById) return jobsById;
+  if (!hydrating) {
+    hydrating = loadJobs().then((jobs) => {
+      jobsById = new Map(jobs.map((job) => [job.id, job]));
+      return jobsById;
+    });
+  }
+  return hydrating;
+};
+
+const saveJobs = (jobs: Map<string, OutboxJob>): Promise<void> =>
+  AsyncStorage.setItem(STORAGE_KEY, JSON.stringify(Array.from(jobs.values())));
 
-const enqueueExclusive = async <T>(operation: () => Promise<T>): Promise<T> => {
-  const resultPromise = queueChain.then(operation);
-  queueChain = resultPromise
-    .then(() => undefined)
-    .catch(() => undefined);
-  return resultPromise;
+// Mutations touch the Map synchronously, so they need no lock. Writes are
+// serialized and coalesced instead: a write snapshots the Map when it starts,
+// and every mutation made before then shares that write, so the last write
+// to land always reflects the latest state.
+let pendingWrite: Promise<void> | null = null;
+let lastWrite: Promise<void> = Promise.resolve();
+
+const persistJobs = (jobs: Map<string, OutboxJob>): Promise<void> => {
+  if (pendingWrite) return pendingWrite;
+  const write = lastWrite
+    .catch(() => undefined)
+    .then(() => {
+      pendingWrite = null;
+      return saveJobs(jobs);
+    });
+  pendingWrite = write;
+  lastWrite = write;
+  return write;
 };
 
 export const Outbox = {
   async queue(job: Omit<OutboxJob, 'id' | 'createdAt'> & { id?: string }): Promise<OutboxJob> {
-    return enqueueExclusive(async () => {
-      const current = await loadJobs();
-      const payload: OutboxJob = {
-        id: job.id ?? nanoid(),
-        kind: job.kind,
-        payload: job.payload,
-        createdAt: Date.now(),
-      };
-      current.push(payload);
-      await saveJobs(current);
-      return payload;
-    });
+    const jobs = await getJobs();
+    const payload: OutboxJob = {
+      id: job.id ?? nanoid(),
+      kind: job.kind,
+      payload: job.payload,
+      createdAt: Date.now(),
+    };
+    jobs.set(payload.id, payload);
+    await persistJobs(jobs);
+    return payload;
   },
 
   async list(): Promise<OutboxJob[]> {
-    return loadJobs();
+    const jobs = await getJobs();
+    return Array.from(jobs.values());
   },
 
   async clear(jobId: string): Promise<void> {
-    await enqueueExclusive(async () => {
-      const jobs = await loadJobs();
-      const filtered = jobs.filter((job) => job.id !== jobId);
-      await saveJobs(filtered);
-    });
+    const jobs = await getJobs();
+    if (!jobs.delete(jobId)) return;
+    await persistJobs(jobs);
   },
 };
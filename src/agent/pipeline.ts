@@ -55,18 +55,20 @@ const toPayloadConfig = (
   crisis_rules: { ...config.crisis_rules },
 });
 
-const GOAL_KEYWORDS = ['goal', 'goals', 'milestone', 'milestones', 'project', 'habit', 'plan'];
+// Substring semantics of the old keyword list ('goals' and 'milestones' were
+// already covered by their singulars), matched in one case-insensitive scan.
+const GOAL_KEYWORD_PATTERN = /goal|milestone|project|habit|plan/i;
+const GOAL_LABEL_PATTERN = /goal/i;
 
 const shouldLoadGoalContext = (
   text: string,
   routedIntent: RoutedIntent,
   classification: ReturnType<typeof classifyRiflettIntent>
 ): boolean => {
-  const normalizedText = text.toLowerCase();
-  if (GOAL_KEYWORDS.some((keyword) => normalizedText.includes(keyword))) {
+  if (GOAL_KEYWORD_PATTERN.test(text)) {
     return true;
   }
-  if (routedIntent.label.toLowerCase().includes('goal')) {
+  if (GOAL_LABEL_PATTERN.test(routedIntent.label)) {
     return true;
   }
   const duplicateKind = classification.duplicateMatch?.kind?.toLowerCase() ?? '';
@@ -123,16 +125,57 @@ type ScoreContextOptions = {
   coachingSuggestion?: { type: 'goal_check' | 'reflection' | string } | null;
 };
 
+const createHourFormatter = (timeZone?: string): Intl.DateTimeFormat | null => {
+  if (!timeZone) return null;
+  try {
+    return new Intl.DateTimeFormat('en-US', {
+      hour: 'numeric',
+      hour12: false,
+      timeZone,
+    });
+  } catch (error) {
+    // Ignore timezone formatting issues
+    return null;
+  }
+};
+
+const coachingScoreForKind = (kind: string, suggestionType: string | null): number => {
+  if (!suggestionType) return 0.5;
+  if (suggestionType === 'goal_check') return kind === 'goal' ? 1 : 0.35;
+  if (suggestionType === 'reflection') return kind === 'entry' ? 1 : 0.35;
+  return 0.6;
+};
+
 export const scoreContextRecords = (
   records: MemoryRecord[],
   options?: ScoreContextOptions
 ): ScoredMemoryRecord[] => {
   if (!records.length) return [];
 
-  const timestamps = records.map((record) => record.ts ?? 0);
-  const meanTs = timestamps.reduce((sum, value) => sum + value, 0) / timestamps.length;
-  const variance = timestamps.reduce((sum, ts) => sum + (ts - meanTs) ** 2, 0) / timestamps.length;
-  const stdTs = Math.sqrt(variance) || 1;
+  let sumTs = 0;
+  for (const record of records) {
+    sumTs += record.ts ?? 0;
+  }
+  const meanTs = sumTs / records.length;
+  let sumSquares = 0;
+  for (const record of records) {
+    const delta = (record.ts ?? 0) - meanTs;
+    sumSquares += delta * delta;
+  }
+  const stdTs = Math.sqrt(sumSquares / records.length) || 1;
+
+  // Everything that does not depend on the record is resolved once per call:
+  // building an Intl.DateTimeFormat is far costlier than the scoring itself.
+  const hourFormatter = createHourFormatter(options?.userTimeZone);
+  let nowHour: number | null = null;
+  if (hourFormatter) {
+    try {
+      nowHour = Number(hourFormatter.format(new Date()));
+    } catch (error) {
+      // Ignore timezone formatting issues
+    }
+  }
+  const suggestionType = options?.coachingSuggestion?.type ?? null;
 
   return records
     .map((record) => {
@@ -145,40 +188,18 @@ export const scoreContextRecords = (
 
       // Time-of-day relevance
       let timeOfDayScore = 0.5;
-      if (options?.userTimeZone) {
+      if (hourFormatter && nowHour !== null && record.ts) {
         try {
-          const recordDate = record.ts ? new Date(record.ts) : null;
-          const now = new Date();
-          if (recordDate) {
-            const formatter = new Intl.DateTimeFormat('en-US', {
-              hour: 'numeric',
-              hour12: false,
-              timeZone: options.userTimeZone,
-            });
-            const recordHour = Number(formatter.format(recordDate));
-            const nowHour = Number(formatter.format(now));
-            const hourDiff = Math.min(Math.abs(recordHour - nowHour), 24 - Math.abs(recordHour - nowHour));
-            timeOfDayScore = Math.max(0, 1 - hourDiff / 12);
-          }
+          const recordHour = Number(hourFormatter.format(new Date(record.ts)));
+          const hourDiff = Math.min(Math.abs(recordHour - nowHour), 24 - Math.abs(recordHour - nowHour));
+          timeOfDayScore = Math.max(0, 1 - hourDiff / 12);
         } catch (error) {
           // Ignore timezone formatting issues
         }
       }
 
-      let coachingScore = 0.5;
-      const suggestionType = options?.coachingSuggestion?.type ?? null;
-      if (suggestionType) {
-        if (suggestionType === 'goal_check') {
-          coachingScore = record.kind === 'goal' ? 1 : 0.35;
-        } else if (suggestionType === 'reflection') {
-          coachingScore = record.kind === 'entry' ? 1 : 0.35;
-        } else {
-          coachingScore = 0.6;
-        }
-      }
-
       const normalizedTimeOfDay = clamp01(timeOfDayScore);
-      const normalizedCoaching = clamp01(coachingScore);
+      const normalizedCoaching = clamp01(coachingScoreForKind(record.kind, suggestionType));
 
       const composite =
         0.3 * recencyScore +
@@ -238,6 +259,13 @@ export async function handleUtterance(
     throw new Error('Utterance text is empty');
   }
 
+  // User config has no dependency on retrieval or classification, so it loads
+  // while the rest of the pipeline runs. The no-op catch only keeps an early
+  // throw from surfacing as an unhandled rejection; the await below still
+  // rethrows.
+  const userConfigPromise = ensureUserConfig(options.userConfig);
+  userConfigPromise.catch(() => undefined);
+
   const searchKinds = options.kindsOverride ?? ['entry', 'goal', 'event', 'pref'];
   const contextRecords = await Memory.searchTopN({
     query: trimmed,
@@ -290,19 +318,24 @@ export async function handleUtterance(
   }
   const withSlots = SlotFiller.fill(trimmed, baseRouted, slotOptions);
 
+  const goalContextPromise: Promise<GoalContextItem[] | undefined> = shouldLoadGoalContext(
+    trimmed,
+    withSlots,
+    classification
+  )
+    ? listActiveGoalsWithContext().catch((goalError: unknown) => {
+        console.warn('[pipeline] goal context fetch failed', goalError);
+        return undefined;
+      })
+    : Promise.resolve(undefined);
+
   const redaction = Redactor.mask(trimmed);
-  const runtimeUserConfig = await ensureUserConfig(options.userConfig);
+  const [runtimeUserConfig, goalContext] = await Promise.all([
+    userConfigPromise,
+    goalContextPromise,
+  ]);
   const userConfig = toPayloadConfig(runtimeUserConfig);
 
-  let goalContext: GoalContextItem[] | undefined;
-  try {
-    if (shouldLoadGoalContext(trimmed, withSlots, classification)) {
-      goalContext = await listActiveGoalsWithContext();
-    }
-  } catch (goalError) {
-    console.warn('[pipeline] goal context fetch failed', goalError);
-  }
-
   const payload: EnrichedPayload = {
     userText: redaction.masked,
     intent: withSlots,
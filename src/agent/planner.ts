@@ -2,7 +2,7 @@ import Constants from "expo-constants";
 import { resolveOpenAIApiKey } from "@/services/ai";
 import type { EnrichedPayload, PlannerResponse } from "@/agent/types";
 import type { GoalContextItem } from "@/types/goal";
-import { EdgeCache } from "@/agent/cache";
+import { EdgeCache, digestKey } from "@/agent/cache";
 
 export interface PlannerResult {
   response: PlannerResponse | null;
@@ -78,7 +78,23 @@ const summarizeGoalContext = (goals?: GoalContextItem[] | null): string => {
   return JSON.stringify(compact, null, 2);
 };
 
-const buildPrompt = (payload: EnrichedPayload): string => {
+interface SerializedSections {
+  slots: string;
+  userConfig: string;
+}
+
+// The slots and user config appear in both the cache key and the prompt.
+// Serialize them once per payload so a cache miss does not walk the same
+// objects twice.
+const serializeSections = (payload: EnrichedPayload): SerializedSections => ({
+  slots: JSON.stringify(payload.intent.slots, null, 2),
+  userConfig: JSON.stringify(payload.userConfig ?? {}, null, 2),
+});
+
+const buildPrompt = (
+  payload: EnrichedPayload,
+  sections: SerializedSections
+): string => {
   const intent = payload.intent;
   const context = payload.contextSnippets.join("\n---\n");
 
@@ -100,7 +116,7 @@ const buildPrompt = (payload: EnrichedPayload): string => {
 ${intent.label} (p=${probability})${secondary}
 
 [SLOTS]
-${JSON.stringify(intent.slots, null, 2)}
+${sections.slots}
 
 [CONTEXT]
 ${context || "n/a"}
@@ -109,7 +125,7 @@ ${context || "n/a"}
 ${payload.userText}
 
 [USER_CONFIG]
-${JSON.stringify(payload.userConfig ?? {}, null, 2)}${goalSection}
+${sections.userConfig}${goalSection}
 """`;
 };
 
@@ -169,13 +185,16 @@ const parseToolArguments = (raw: string): PlannerResponse | null => {
   }
 };
 
-const buildCacheKey = (payload: EnrichedPayload): string => {
+const buildCacheKey = (
+  payload: EnrichedPayload,
+  sections: SerializedSections
+): string => {
   return JSON.stringify({
     label: payload.intent.label,
-    slots: payload.intent.slots,
+    slots: sections.slots,
     context: payload.contextSnippets,
     text: payload.userText,
-    userConfig: payload.userConfig,
+    userConfig: sections.userConfig,
     goalContext: payload.goalContext,
   });
 };
@@ -197,7 +216,8 @@ export async function planAction(args: {
   payload: EnrichedPayload;
   apiKey?: string;
 }): Promise<PlannerResult> {
-  const cacheKey = buildCacheKey(args.payload);
+  const sections = serializeSections(args.payload);
+  const cacheKey = digestKey(buildCacheKey(args.payload, sections));
   const cached = await EdgeCache.get<PlannerResponse>(cacheKey);
   if (cached) {
     return {
@@ -217,7 +237,7 @@ export async function planAction(args: {
     },
     messages: [
       { role: "system", content: PLANNER_SYSTEM_PROMPT },
-      { role: "user", content: buildPrompt(args.payload) },
+      { role: "user", content: buildPrompt(args.payload, sections) },
     ],
   };
 
@@ -262,10 +282,11 @@ export async function planAction(args: {
   const rawArgs: string | undefined = toolCall?.function?.arguments;
   const parsed = rawArgs ? parseToolArguments(rawArgs) : null;
 
-  if (parsed) {
+  if (parsed && rawArgs) {
     const ttl = plannerTTL(parsed.action);
     if (ttl > 0) {
-      EdgeCache.set(cacheKey, parsed, ttl).catch((error) => {
+      // rawArgs is the JSON `parsed` came from; reuse it for the stored entry.
+      EdgeCache.set(cacheKey, parsed, ttl, rawArgs).catch((error) => {
         console.warn("[planner] cache set failed", error);
       });
     }
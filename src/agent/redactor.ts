@@ -2,63 +2,89 @@ import type { RedactionResult } from "./types";
 
 interface PatternConfig {
   name: string;
-  createRegex: () => RegExp;
+  pattern: RegExp;
   mask: (index: number) => string;
   isMatchValid?: (match: string) => boolean;
 }
 
+// Counts ASCII digits with a char-code range check; no regex or stripped copy
+// of the candidate is created per match.
+const countDigits = (value: string): number => {
+  let count = 0;
+  for (let i = 0; i < value.length; i += 1) {
+    const code = value.charCodeAt(i);
+    if (code >= 48 && code <= 57) count += 1;
+  }
+  return count;
+};
+
 const PATTERNS: PatternConfig[] = [
   {
     name: "email",
-    createRegex: () => /[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}/g,
+    pattern: /[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}/,
     mask: (i) => `[EMAIL_${i}]`,
   },
   {
     name: "phone",
-    createRegex: () =>
-      /(?:\+?\d{1,3}[\s-]?)?(?:\(\d{2,3}\)|\d{2,3})[\s-]?\d{3}[\s-]?\d{4}/g,
+    pattern: /(?:\+?\d{1,3}[\s-]?)?(?:\(\d{2,3}\)|\d{2,3})[\s-]?\d{3}[\s-]?\d{4}/,
     mask: (i) => `[PHONE_${i}]`,
   },
   {
     name: "card",
     // Matches 13–19 digits allowing spaces or dashes between groups.
     // Still prone to false positives; consider Luhn validation or a dedicated library in production.
-    createRegex: () => /\b(?:\d[\s-]*){13,19}\d\b/g,
+    pattern: /\b(?:\d[\s-]*){13,19}\d\b/,
     isMatchValid: (match) => {
-      const digitsOnly = match.replace(/\D/g, "");
-      return digitsOnly.length >= 13 && digitsOnly.length <= 19;
+      const digits = countDigits(match);
+      return digits >= 13 && digits <= 19;
     },
     mask: (i) => `[CARD_${i}]`,
   },
   {
     name: "address",
-    createRegex: () =>
-      /\b\d{1,5}\s+[^\n,]+(?:Street|St\.?|Avenue|Ave\.?|Road|Rd\.?|Boulevard|Blvd\.?|Lane|Ln\.?|Drive|Dr\.?|Court|Ct\.?|Place|Pl\.?)\b/gi,
+    pattern:
+      /\b\d{1,5}\s+[^\n,]+(?:Street|St\.?|Avenue|Ave\.?|Road|Rd\.?|Boulevard|Blvd\.?|Lane|Ln\.?|Drive|Dr\.?|Court|Ct\.?|Place|Pl\.?)\b/,
     mask: (i) => `[ADDR_${i}]`,
   },
 ];
 
+// Every pattern is wrapped in one capture group of a single alternation,
+// compiled once at load, so mask() is one scan with no per-call compiles.
+// The group that matched identifies the pattern. The address pattern needs
+// case-insensitive matching; the other sources are unaffected by the flag.
+const COMBINED_PATTERN = new RegExp(
+  PATTERNS.map((pattern) => `(${pattern.pattern.source})`).join("|"),
+  "gi"
+);
+
+// Every pattern needs an "@" or a digit, so text with neither cannot match
+// and skips the alternation entirely (most chat utterances).
+const CANDIDATE_CHAR = /[@\d]/;
+
 export const Redactor = {
   mask(text: string): RedactionResult {
-    if (!text) {
+    if (!text || !CANDIDATE_CHAR.test(text)) {
       return { masked: text, replacementMap: {} };
     }
 
-    let masked = text;
     const replacementMap: Record<string, string> = {};
+    const counts = new Array<number>(PATTERNS.length).fill(0);
 
-    PATTERNS.forEach((pattern) => {
-      let index = 0;
-      const regex = pattern.createRegex();
-      masked = masked.replace(regex, (match) => {
-        if (pattern.isMatchValid && !pattern.isMatchValid(match)) {
-          return match;
-        }
-        const key = pattern.mask(index);
-        replacementMap[key] = match;
-        index += 1;
-        return key;
-      });
+    COMBINED_PATTERN.lastIndex = 0;
+    const masked = text.replace(COMBINED_PATTERN, (match: string, ...groups: unknown[]) => {
+      let patternIndex = 0;
+      while (patternIndex < PATTERNS.length - 1 && groups[patternIndex] === undefined) {
+        patternIndex += 1;
+      }
+      const pattern = PATTERNS[patternIndex]!;
+      if (pattern.isMatchValid && !pattern.isMatchValid(match)) {
+        return match;
+      }
+      const index = counts[patternIndex]!;
+      counts[patternIndex] = index + 1;
+      const key = pattern.mask(index);
+      replacementMap[key] = match;
+      return key;
     });
 
     return { masked, replacementMap };
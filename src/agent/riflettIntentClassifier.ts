@@ -1,6 +1,8 @@
 import type { MemoryRecord } from '@/agent/memory';
 import { toTitleCase } from '@/utils/strings';
+import { createPhraseMatcher } from '@/agent/utils/phraseMatcher';
 import { ContextWindow } from './contextWindow';
+import { LruCache } from '@/utils/lru';
 
 export type RiflettIntentLabel =
   | 'conversational'
@@ -31,6 +33,8 @@ export interface ClassificationMeta {
 }
 
 const COMMAND_PATTERN = /^\s*\//;
+// The phrase lists are readonly tuples compiled into PHRASE_MATCHER at load;
+// their order carries no cost, since the automaton reads every list at once.
 const SEARCH_PHRASES = [
   'find',
   'show me',
@@ -40,7 +44,7 @@ const SEARCH_PHRASES = [
   'what did i write',
   'look up',
   'list',
-];
+] as const;
 const ADDITIVE_PHRASES = [
   'also',
   'update',
@@ -50,7 +54,7 @@ const ADDITIVE_PHRASES = [
   'plus',
   'adding',
   'one more thing',
-];
+] as const;
 const SAVE_PHRASES = [
   'save',
   'log',
@@ -60,7 +64,7 @@ const SAVE_PHRASES = [
   'note that',
   'journal',
   'record',
-];
+] as const;
 const TEMPORAL_MARKERS = [
   'today',
   'tonight',
@@ -79,7 +83,7 @@ const TEMPORAL_MARKERS = [
   'friday',
   'saturday',
   'sunday',
-];
+] as const;
 const ACTION_VERBS = [
   'finished',
   'completed',
@@ -98,36 +102,76 @@ const ACTION_VERBS = [
   'wrote',
   'built',
   'shipped',
-];
-const PRONOUN_ANCHORS = /\b(it|this|that|the goal|the entry|that goal|this entry|that plan|the plan|that project|this project)\b/i;
-const QUESTION_MARK = /\?/;
+] as const;
+// "that goal", "this entry" and friends are already covered by the bare
+// "that"/"this" alternatives, so only the "the ..." phrases need spelling out;
+// the factored, non-capturing form tries far fewer branches per position.
+const PRONOUN_ANCHORS = /\b(?:it|this|that|the (?:goal|entry|plan))\b/i;
 const TIME_REGEX = /\b(\d{1,2}(:\d{2})?\s?(am|pm))\b/i;
-
-const containsPhrase = (text: string, phrases: string[]): boolean =>
-  phrases.some((phrase) => text.includes(phrase));
-
-const hasTemporalMarker = (text: string): boolean =>
-  containsPhrase(text, TEMPORAL_MARKERS) || TIME_REGEX.test(text);
-
-const hasSaveLanguage = (text: string): boolean => containsPhrase(text, SAVE_PHRASES);
-
-const hasAdditiveLanguage = (text: string): boolean => containsPhrase(text, ADDITIVE_PHRASES);
-
-const hasActionLanguage = (text: string): boolean =>
-  ACTION_VERBS.some((verb) => text.includes(verb));
-
-const isSearchQuery = (text: string): boolean => containsPhrase(text, SEARCH_PHRASES);
-
-const baseCandidate = (label: RiflettIntentLabel, confidence: number): ClassificationCandidate => ({
-  label,
-  confidence,
-});
+const WORD_PATTERN = /\S+/g;
+
+const LONG_MESSAGE_WORDS = 25;
+const VERY_LONG_MESSAGE_WORDS = 60;
+
+// Counts whitespace-separated words with an exec loop over one precompiled
+// pattern, so no token array is materialised just to read its length. Only
+// the two length thresholds matter, so counting stops once past the higher
+// one instead of walking the rest of a long journal entry.
+const countWords = (text: string, limit: number): number => {
+  let count = 0;
+  WORD_PATTERN.lastIndex = 0;
+  while (count <= limit && WORD_PATTERN.exec(text)) {
+    count += 1;
+  }
+  return count;
+};
+
+const SEARCH_BIT = 1;
+const ADDITIVE_BIT = 2;
+const SAVE_BIT = 4;
+const TEMPORAL_BIT = 8;
+const ACTION_BIT = 16;
+
+// All five phrase lists are matched by one automaton in a single pass over
+// the lowercased message, instead of one includes() scan per phrase.
+const PHRASE_MATCHER = createPhraseMatcher([
+  [SEARCH_BIT, SEARCH_PHRASES],
+  [ADDITIVE_BIT, ADDITIVE_PHRASES],
+  [SAVE_BIT, SAVE_PHRASES],
+  [TEMPORAL_BIT, TEMPORAL_MARKERS],
+  [ACTION_BIT, ACTION_VERBS],
+]);
+
+// Every branch scores candidates from a small fixed set of (label,
+// confidence) pairs, so candidates are interned as frozen objects and shared
+// across classifications (and cached results) instead of rebuilt per call.
+const candidatePool = new Map<string, ClassificationCandidate>();
+
+const baseCandidate = (label: RiflettIntentLabel, confidence: number): ClassificationCandidate => {
+  const key = `${label}:${confidence}`;
+  let candidate = candidatePool.get(key);
+  if (!candidate) {
+    candidate = Object.freeze({ label, confidence });
+    candidatePool.set(key, candidate);
+  }
+  return candidate;
+};
 
 const DUPLICATE_THRESHOLD = 0.85;
 const DUPLICATE_MIN_PREFIX_LENGTH = 20;
 
-function pickDuplicate(records: MemoryRecord[]): MemoryRecord | null {
-  return records.find((record) => record.score >= DUPLICATE_THRESHOLD) ?? null;
+// Records arrive ordered by composite score, not raw similarity, so the first
+// one over the threshold is not necessarily records[0]. A plain indexed loop
+// keeps that first-match rule without allocating a predicate closure on every
+// classification (this runs before the result cache lookup).
+function pickDuplicate(records: readonly MemoryRecord[]): MemoryRecord | null {
+  for (let i = 0; i < records.length; i += 1) {
+    const record = records[i]!;
+    if (record.score >= DUPLICATE_THRESHOLD) {
+      return record;
+    }
+  }
+  return null;
 }
 
 function mapKindToEntryType(kind?: string | null): string | null {
@@ -139,15 +183,34 @@ function mapKindToEntryType(kind?: string | null): string | null {
   return null;
 }
 
+// Classification only depends on the message, the duplicate record (if any)
+// and the context window, so results are cached per window version. Short
+// repeated replies ("ok", "thanks") then skip every scan.
+const CLASSIFICATION_CACHE_CAPACITY = 1024;
+const classificationCache = new LruCache<string, ClassificationMeta>(CLASSIFICATION_CACHE_CAPACITY);
+
+const classificationKey = (
+  trimmed: string,
+  duplicate: MemoryRecord | null,
+  windowVersion: number
+): string =>
+  duplicate
+    ? `${windowVersion}\u0000${duplicate.id}\u0000${duplicate.score}\u0000${duplicate.kind}\u0000${duplicate.text}\u0000${trimmed}`
+    : `${windowVersion}\u0000\u0000${trimmed}`;
+
+// Hands out fresh arrays so callers can never mutate a cached result; the
+// candidates themselves are frozen pool entries and are shared as-is.
+const copyClassification = (meta: ClassificationMeta): ClassificationMeta => ({
+  ...meta,
+  reasons: meta.reasons.slice(),
+  topCandidates: meta.topCandidates.slice(),
+});
+
 export function classifyRiflettIntent(params: {
   text: string;
   contextRecords: MemoryRecord[];
 }): ClassificationMeta {
   const trimmed = params.text.trim();
-  const lower = trimmed.toLowerCase();
-  const reasons: string[] = [];
-  const contextSnapshot = ContextWindow.snapshot();
-  const recentMessages = ContextWindow.recent();
 
   if (!trimmed) {
     return {
@@ -158,6 +221,28 @@ export function classifyRiflettIntent(params: {
     };
   }
 
+  const duplicate = pickDuplicate(params.contextRecords);
+  const key = classificationKey(trimmed, duplicate, ContextWindow.version());
+  const cached = classificationCache.get(key);
+  if (cached) {
+    return copyClassification(cached);
+  }
+
+  const result = classifyUncached(trimmed, duplicate);
+  classificationCache.set(key, result);
+  return copyClassification(result);
+}
+
+function classifyUncached(trimmed: string, duplicate: MemoryRecord | null): ClassificationMeta {
+  const lower = trimmed.toLowerCase();
+  const reasons: string[] = [];
+  // Snapshot fields are bound once; the recent-message copy is only taken in
+  // the one branch that reads it.
+  const contextSnapshot = ContextWindow.snapshot();
+  const inWindow = contextSnapshot?.isActive ?? false;
+  const snapshotEntryId = contextSnapshot?.entryId ?? null;
+  const snapshotEntryType = contextSnapshot?.entryType ?? null;
+
   if (COMMAND_PATTERN.test(trimmed)) {
     reasons.push('Slash-prefixed command detected');
     return {
@@ -168,7 +253,9 @@ export function classifyRiflettIntent(params: {
     };
   }
 
-  if (isSearchQuery(lower)) {
+  const phraseBits = PHRASE_MATCHER.scan(lower);
+
+  if (phraseBits & SEARCH_BIT) {
     reasons.push('Search verb detected');
     const confidence = lower.length > 24 ? 0.94 : 0.9;
     return {
@@ -182,7 +269,6 @@ export function classifyRiflettIntent(params: {
     };
   }
 
-  const duplicate = pickDuplicate(params.contextRecords);
   const duplicateMeta = duplicate
     ? {
         id: duplicate.id,
@@ -192,9 +278,7 @@ export function classifyRiflettIntent(params: {
       }
     : null;
 
-  const hasAdditive = hasAdditiveLanguage(lower);
-  const inWindow = Boolean(contextSnapshot?.isActive);
-  const hasPronounAnchor = PRONOUN_ANCHORS.test(trimmed);
+  const hasAdditive = (phraseBits & ADDITIVE_BIT) !== 0;
 
   if (duplicateMeta && hasAdditive) {
     reasons.push('High-similarity memory match with additive language');
@@ -214,14 +298,15 @@ export function classifyRiflettIntent(params: {
     };
   }
 
-  if (inWindow && hasPronounAnchor) {
+  // The anchor only matters inside an active window, so skip the scan otherwise.
+  if (inWindow && PRONOUN_ANCHORS.test(trimmed)) {
     reasons.push('Within entry context window with pronoun reference');
     return {
       label: 'entry_discuss',
       confidence: 0.96,
       reasons,
-      targetEntryId: contextSnapshot?.entryId ?? null,
-      targetEntryType: contextSnapshot?.entryType ?? null,
+      targetEntryId: snapshotEntryId,
+      targetEntryType: snapshotEntryType,
       duplicateMatch: duplicateMeta,
       topCandidates: [
         baseCandidate('entry_discuss', 0.96),
@@ -235,15 +320,15 @@ export function classifyRiflettIntent(params: {
     reasons.push('High-similarity memory match without clear additive cue');
   }
 
-  const hasSave = hasSaveLanguage(lower);
-  const hasTemporal = hasTemporalMarker(lower);
-  const hasAction = hasActionLanguage(lower);
-  const isQuestion = QUESTION_MARK.test(trimmed);
-  const wordCount = trimmed.split(/\s+/).filter(Boolean).length;
+  const hasSave = (phraseBits & SAVE_BIT) !== 0;
+  const hasTemporal = (phraseBits & TEMPORAL_BIT) !== 0 || TIME_REGEX.test(lower);
+  const hasAction = (phraseBits & ACTION_BIT) !== 0;
+  const isQuestion = trimmed.includes('?');
+  const wordCount = countWords(trimmed, VERY_LONG_MESSAGE_WORDS);
 
-  if (!isQuestion && (hasSave || (hasTemporal && hasAction) || wordCount > 25)) {
+  if (!isQuestion && (hasSave || (hasTemporal && hasAction) || wordCount > LONG_MESSAGE_WORDS)) {
     const createConfidence = Math.min(
-      0.86 + (hasSave ? 0.08 : 0) + (hasTemporal ? 0.03 : 0) + (wordCount > 60 ? 0.03 : 0),
+      0.86 + (hasSave ? 0.08 : 0) + (hasTemporal ? 0.03 : 0) + (wordCount > VERY_LONG_MESSAGE_WORDS ? 0.03 : 0),
       0.97,
     );
     reasons.push('Declarative content suitable for structured capture');
@@ -288,8 +373,8 @@ export function classifyRiflettIntent(params: {
       label: 'entry_discuss',
       confidence: 0.78,
       reasons,
-      targetEntryId: contextSnapshot?.entryId ?? null,
-      targetEntryType: contextSnapshot?.entryType ?? null,
+      targetEntryId: snapshotEntryId,
+      targetEntryType: snapshotEntryType,
       duplicateMatch: duplicateMeta,
       topCandidates: [
         baseCandidate('entry_discuss', 0.78),
@@ -301,7 +386,7 @@ export function classifyRiflettIntent(params: {
 
   if (duplicateMeta && duplicateMeta.text.length >= DUPLICATE_MIN_PREFIX_LENGTH) {
     const duplicatePrefix = duplicateMeta.text.slice(0, DUPLICATE_MIN_PREFIX_LENGTH).toLowerCase();
-    const recentMatch = recentMessages.some((m) => m.text.toLowerCase().includes(duplicatePrefix));
+    const recentMatch = ContextWindow.recent().some((m) => m.text.toLowerCase().includes(duplicatePrefix));
 
     if (recentMatch) {
       reasons.push('Recent message references similar content; favour append');
@@ -329,8 +414,8 @@ export function classifyRiflettIntent(params: {
     label: 'conversational',
     confidence: conversationalConfidence,
     reasons,
-    targetEntryId: contextSnapshot?.isActive ? contextSnapshot.entryId : null,
-    targetEntryType: contextSnapshot?.entryType ?? null,
+    targetEntryId: inWindow ? snapshotEntryId : null,
+    targetEntryType: snapshotEntryType,
     duplicateMatch: duplicateMeta,
     topCandidates: [
       baseCandidate('conversational', conversationalConfidence),
@@ -340,6 +425,22 @@ export function classifyRiflettIntent(params: {
   };
 }
 
+const formatNativeLabel = (label: string): string => toTitleCase(label.replace(/_/g, ' '));
+
+// The label set is closed, so every native label is formatted once at load.
+const NATIVE_LABELS = new Map<string, string>(
+  (
+    [
+      'conversational',
+      'entry_create',
+      'entry_discuss',
+      'entry_append',
+      'command',
+      'search_query',
+    ] satisfies RiflettIntentLabel[]
+  ).map((label) => [label, formatNativeLabel(label)])
+);
+
 export function toNativeLabel(label: RiflettIntentLabel): string {
-  return toTitleCase(label.replace(/_/g, ' '));
+  return NATIVE_LABELS.get(label) ?? formatNativeLabel(label);
 }
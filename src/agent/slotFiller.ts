@@ -47,22 +47,66 @@ const minutesToISO = (date: Date): string => {
   return date.toISOString();
 };
 
-const resolveNow = (now?: Date): Date => (now ? new Date(now) : new Date());
+// `now` is only ever read: every helper that needs to shift a date mutates
+// its own copy, so the caller's Date is used as-is rather than cloned.
+const resolveNow = (now?: Date): Date => now ?? new Date();
 
-const findWeekday = (text: string, now: Date): ParsedDateParts => {
-  const match = text.match(/\b(next|this)?\s*(sunday|monday|tuesday|wednesday|thursday|friday|saturday)\b/i);
-  if (!match) return {};
+// Every date cue is matched by one alternation in a single pass. Each named
+// top-level group keeps the first (leftmost) occurrence of its kind, and the
+// precedence below matches the old separate scans: explicit (iso, slash,
+// month name), then today/tomorrow, then weekday, then tonight. The
+// lookaheads stop a lower-precedence cue from swallowing the digits of a
+// higher-precedence one ("may 5/6", "3/4/2025-06-01") that the separate
+// scans would have found.
+const DATE_CUE_PATTERN = new RegExp(
+  [
+    String.raw`(?<iso>\b(?<isoYear>\d{4})-(?<isoMonth>\d{2})-(?<isoDay>\d{2})\b)`,
+    String.raw`(?<slash>\b(?<slashMonth>\d{1,2})\/(?<slashDay>\d{1,2})(?:\/(?<slashYear>\d{2,4})(?!-\d{2}-\d{2}\b))?\b)`,
+    String.raw`(?<month>\b(?<monthName>jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\s+(?<monthDay>\d{1,2})(?!\/\d)(?:,?\s*(?<monthYear>\d{4})(?!-\d{2}-\d{2}\b))?\b)`,
+    String.raw`(?<today>\btoday\b)`,
+    String.raw`(?<tomorrow>\btomorrow\b)`,
+    String.raw`(?<tonight>\btonight\b)`,
+    String.raw`(?<weekday>\b(?<weekdayHint>next|this)?\s*(?<weekdayName>sunday|monday|tuesday|wednesday|thursday|friday|saturday)\b)`,
+  ].join('|'),
+  'gi'
+);
 
-  const [, hint, weekdayRaw] = match;
-  if (!weekdayRaw) {
-    return {};
+type DateCueKind = 'iso' | 'slash' | 'month' | 'today' | 'tomorrow' | 'tonight' | 'weekday';
+
+const DATE_CUE_KINDS: readonly DateCueKind[] = [
+  'iso',
+  'slash',
+  'month',
+  'today',
+  'tomorrow',
+  'tonight',
+  'weekday',
+];
+
+const scanDateCues = (text: string): Partial<Record<DateCueKind, RegExpExecArray>> => {
+  const cues: Partial<Record<DateCueKind, RegExpExecArray>> = {};
+  let remaining = DATE_CUE_KINDS.length;
+  DATE_CUE_PATTERN.lastIndex = 0;
+  let match = DATE_CUE_PATTERN.exec(text);
+  while (match && remaining > 0) {
+    const groups = match.groups ?? {};
+    const kind = DATE_CUE_KINDS.find((candidate) => groups[candidate] !== undefined);
+    if (kind && !cues[kind]) {
+      cues[kind] = match;
+      remaining -= 1;
+    }
+    match = DATE_CUE_PATTERN.exec(text);
   }
+  return cues;
+};
+
+const resolveWeekday = (match: RegExpExecArray, now: Date): Date | undefined => {
+  const hint = match.groups?.weekdayHint;
+  const weekdayRaw = match.groups?.weekdayName;
+  if (!weekdayRaw) return undefined;
   const weekday = WEEKDAY_ORDER[weekdayRaw.toLowerCase()];
-  if (weekday === undefined) {
-    return {};
-  }
-  const today = new Date(now);
-  const todayIdx = today.getDay();
+  if (weekday === undefined) return undefined;
+  const todayIdx = now.getDay();
   let daysAhead = (weekday - todayIdx + 7) % 7;
 
   if (daysAhead === 0 && hint?.toLowerCase() === 'next') {
@@ -73,63 +117,60 @@ const findWeekday = (text: string, now: Date): ParsedDateParts => {
     daysAhead = 7; // assume future if unspecified and same day mentioned
   }
 
-  const target = new Date(today);
-  target.setDate(today.getDate() + daysAhead);
-  return { date: target };
-};
-
-const findRelativeDay = (text: string, now: Date): ParsedDateParts => {
-  if (/\btoday\b/i.test(text)) {
-    return { date: new Date(now) };
-  }
-  if (/\btomorrow\b/i.test(text)) {
-    const tomorrow = new Date(now);
-    tomorrow.setDate(tomorrow.getDate() + 1);
-    return { date: tomorrow };
-  }
-  if (/\bday after tomorrow\b/i.test(text)) {
-    const target = new Date(now);
-    target.setDate(target.getDate() + 2);
-    return { date: target };
-  }
-  return {};
+  const target = new Date(now);
+  target.setDate(now.getDate() + daysAhead);
+  return target;
 };
 
-const findExplicitDate = (text: string, now: Date): ParsedDateParts => {
-  const isoMatch = text.match(/\b(\d{4})-(\d{2})-(\d{2})\b/);
-  if (isoMatch) {
-    const [, y, m, d] = isoMatch;
-    const date = new Date(Number(y), Number(m) - 1, Number(d));
-    return { date };
+const resolveExplicitDate = (
+  cues: Partial<Record<DateCueKind, RegExpExecArray>>,
+  now: Date
+): Date | undefined => {
+  if (cues.iso) {
+    const { isoYear, isoMonth, isoDay } = cues.iso.groups ?? {};
+    return new Date(Number(isoYear), Number(isoMonth) - 1, Number(isoDay));
   }
 
-  const slashMatch = text.match(/\b(\d{1,2})\/(\d{1,2})(?:\/(\d{2,4}))?\b/);
-  if (slashMatch) {
-    const [, monthRaw, dayRaw, yearRaw] = slashMatch;
+  if (cues.slash) {
+    const { slashMonth: monthRaw, slashDay: dayRaw, slashYear: yearRaw } = cues.slash.groups ?? {};
     if (!monthRaw || !dayRaw) {
-      return {};
+      return undefined;
     }
     const year = yearRaw ? Number(yearRaw.length === 2 ? `20${yearRaw}` : yearRaw) : now.getFullYear();
-    const date = new Date(year, Number(monthRaw) - 1, Number(dayRaw));
-    return { date };
+    return new Date(year, Number(monthRaw) - 1, Number(dayRaw));
   }
 
-  const monthMatch = text.match(/\b(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\s+(\d{1,2})(?:,?\s*(\d{4}))?\b/i);
-  if (monthMatch) {
-    const [, monthRaw, dayRaw, yearRaw] = monthMatch;
+  if (cues.month) {
+    const { monthName: monthRaw, monthDay: dayRaw, monthYear: yearRaw } = cues.month.groups ?? {};
     if (!monthRaw || !dayRaw) {
-      return {};
+      return undefined;
     }
     const month = MONTHS.indexOf(monthRaw.toLowerCase());
     if (month < 0) {
-      return {};
+      return undefined;
     }
     const year = yearRaw ? Number(yearRaw) : now.getFullYear();
-    const date = new Date(year, month, Number(dayRaw));
-    return { date };
+    return new Date(year, month, Number(dayRaw));
   }
 
-  return {};
+  return undefined;
+};
+
+const resolveRelativeDay = (
+  cues: Partial<Record<DateCueKind, RegExpExecArray>>,
+  now: Date
+): Date | undefined => {
+  if (cues.today) {
+    return now;
+  }
+  // "day after tomorrow" always contains "tomorrow", which was checked first,
+  // so it has always resolved to tomorrow.
+  if (cues.tomorrow) {
+    const tomorrow = new Date(now);
+    tomorrow.setDate(tomorrow.getDate() + 1);
+    return tomorrow;
+  }
+  return undefined;
 };
 
 const applyTime = (text: string, seed: Date | undefined, now: Date): ParsedDateParts => {
@@ -152,7 +193,7 @@ const applyTime = (text: string, seed: Date | undefined, now: Date): ParsedDateP
     }
   }
 
-  const base = seed ? new Date(seed) : new Date(now);
+  const base = new Date(seed ?? now);
   base.setHours(hours, minutes, 0, 0);
   return { date: base, timeApplied: true };
 };
@@ -171,18 +212,19 @@ const deriveSlots = (text: string, baseIntent: RoutedIntent, options?: SlotFillO
   const resultSlots: Record<string, string> = { ...baseIntent.slots };
   const normalizedLabel = (baseIntent.rawLabel || baseIntent.label).toLowerCase();
 
-  const weekday = findWeekday(text, now);
-  const relative = findRelativeDay(text, now);
-  const explicit = findExplicitDate(text, now);
+  const cues = scanDateCues(text);
 
-  let candidateDate = explicit.date ?? relative.date ?? weekday.date;
+  let candidateDate =
+    resolveExplicitDate(cues, now) ??
+    resolveRelativeDay(cues, now) ??
+    (cues.weekday ? resolveWeekday(cues.weekday, now) : undefined);
 
-  if (!candidateDate && /\btonight\b/i.test(text)) {
+  if (!candidateDate && cues.tonight) {
     candidateDate = new Date(now);
     candidateDate.setHours(20, 0, 0, 0);
   }
 
-  const time = applyTime(text, candidateDate ?? new Date(now), now);
+  const time = applyTime(text, candidateDate, now);
   if (time.date) {
     candidateDate = time.date;
   }
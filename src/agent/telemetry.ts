@@ -5,22 +5,6 @@ import type { RouteDecision } from '@/agent/types';
 const STORAGE_KEY = 'riflett_traces_v2';
 const MAX_TRACES = 100;
 
-let storageLock = Promise.resolve<void>(undefined);
-
-const withStorageLock = async <T>(task: () => Promise<T>): Promise<T> => {
-  let release: (() => void) | null = null;
-  const next = new Promise<void>((resolve) => {
-    release = resolve;
-  });
-  const previous = storageLock;
-  storageLock = previous.then(() => next);
-  try {
-    await previous;
-    return await task();
-  } finally {
-    release?.();
-  }
-};
 export interface RetrievalTelemetry {
   id: string;
   kind: string;
@@ -83,17 +67,47 @@ const loadTraces = async (): Promise<TraceEvent[]> => {
   }
 };
 
+// Traces are held newest-first in memory, hydrated (and sorted) once from
+// storage. New traces are unshifted and the tail trimmed, so the list never
+// needs re-sorting; mutations are synchronous and need no lock.
+let traceStore: TraceEvent[] | null = null;
+let hydrating: Promise<TraceEvent[]> | null = null;
+
+const getTraces = async (): Promise<TraceEvent[]> => {
+  if (traceStore) return traceStore;
+  if (!hydrating) {
+    hydrating = loadTraces().then((traces) => {
+      traceStore = traces.sort((a, b) => b.ts - a.ts).slice(0, MAX_TRACES);
+      return traceStore;
+    });
+  }
+  return hydrating;
+};
+
 const saveTraces = async (traces: TraceEvent[]): Promise<void> => {
-  const trimmed = traces
-    .sort((a, b) => b.ts - a.ts)
-    .slice(0, MAX_TRACES);
   try {
-    await AsyncStorage.setItem(STORAGE_KEY, JSON.stringify(trimmed));
+    await AsyncStorage.setItem(STORAGE_KEY, JSON.stringify(traces));
   } catch (error) {
     console.warn('[telemetry] save failed', error);
   }
 };
 
+// Same write coalescing as the outbox: a write serializes the list when it
+// starts, so every mutation made before then shares it.
+let pendingWrite: Promise<void> | null = null;
+let lastWrite: Promise<void> = Promise.resolve();
+
+const persistTraces = (traces: TraceEvent[]): Promise<void> => {
+  if (pendingWrite) return pendingWrite;
+  const write = lastWrite.then(() => {
+    pendingWrite = null;
+    return saveTraces(traces);
+  });
+  pendingWrite = write;
+  lastWrite = write;
+  return write;
+};
+
 export const Telemetry = {
   async record(params: {
     maskedUserText: string;
@@ -104,39 +118,38 @@ export const Telemetry = {
     redactionSummary: Record<string, number>;
     startedAt: number;
   }): Promise<string> {
-    return withStorageLock(async () => {
-      const traces = await loadTraces();
-      const id = nanoid();
-      traces.unshift({
-        id,
-        ts: Date.now(),
-        maskedUserText: params.maskedUserText,
-        intentLabel: params.intentLabel,
-        intentConfidence: params.intentConfidence,
-        decision: params.decision,
-        retrieval: params.retrieval,
-        redactionSummary: params.redactionSummary,
-        latencyMs: Date.now() - params.startedAt,
-        planner: null,
-        action: null,
-      });
-      await saveTraces(traces);
-      return id;
+    const traces = await getTraces();
+    const id = nanoid();
+    traces.unshift({
+      id,
+      ts: Date.now(),
+      maskedUserText: params.maskedUserText,
+      intentLabel: params.intentLabel,
+      intentConfidence: params.intentConfidence,
+      decision: params.decision,
+      retrieval: params.retrieval,
+      redactionSummary: params.redactionSummary,
+      latencyMs: Date.now() - params.startedAt,
+      planner: null,
+      action: null,
     });
+    if (traces.length > MAX_TRACES) {
+      traces.length = MAX_TRACES;
+    }
+    // The trace is already visible in memory; the caller only needs its id,
+    // so the write proceeds in the background (saveTraces never rejects).
+    void persistTraces(traces);
+    return id;
   },
 
   async update(id: string, patch: Partial<TraceEvent>): Promise<void> {
-    await withStorageLock(async () => {
-      const traces = await loadTraces();
-      const next = traces.map((trace) =>
-        trace.id === id
-          ? {
-              ...trace,
-              ...patch,
-            }
-          : trace
-      );
-      await saveTraces(next);
-    });
+    const traces = await getTraces();
+    const index = traces.findIndex((trace) => trace.id === id);
+    if (index === -1) return;
+    traces[index] = {
+      ...traces[index]!,
+      ...patch,
+    };
+    await persistTraces(traces);
   },
 };
@@ -54,6 +54,24 @@ const cloneConfig = (config: RuntimeConfig): RuntimeConfig => ({
   crisis_rules: { ...config.crisis_rules },
 });
 
+// The cached config is only ever replaced, never mutated, so one frozen copy
+// per cached object can be shared by every snapshot() caller and listener
+// until the next update or remote load swaps it.
+let sharedSource: RuntimeConfig | null = null;
+let sharedSnapshot: RuntimeConfig | null = null;
+
+const snapshotOf = (config: RuntimeConfig): RuntimeConfig => {
+  if (sharedSource !== config || !sharedSnapshot) {
+    const copy = cloneConfig(config);
+    if (copy.user_settings) Object.freeze(copy.user_settings);
+    Object.freeze(copy.privacy_gates);
+    Object.freeze(copy.crisis_rules);
+    sharedSnapshot = Object.freeze(copy);
+    sharedSource = config;
+  }
+  return sharedSnapshot;
+};
+
 const persistConfig = async (config: RuntimeConfig) => {
   const payload: StoredConfig = {
     version: STORAGE_VERSION,
@@ -64,7 +82,7 @@ const persistConfig = async (config: RuntimeConfig) => {
 
 const notifyListeners = (config: RuntimeConfig) => {
   if (listeners.size === 0) return;
-  const snapshot = cloneConfig(config);
+  const snapshot = snapshotOf(config);
   for (const listener of listeners) {
     try {
       listener(snapshot);
@@ -152,29 +170,34 @@ const mergeConfigs = (
     ...current,
     ...patch,
     user_settings: (patch.user_settings ?? current.user_settings) || null,
+    // normalizeRuntime copies both maps, so unpatched ones are passed through.
     privacy_gates: patch.privacy_gates
       ? { ...current.privacy_gates, ...patch.privacy_gates }
-      : { ...current.privacy_gates },
+      : current.privacy_gates,
     crisis_rules: patch.crisis_rules
       ? { ...current.crisis_rules, ...patch.crisis_rules }
-      : { ...current.crisis_rules },
+      : current.crisis_rules,
     resolved_at: patch.resolved_at ?? nowIso(),
   };
   return normalizeRuntime(merged);
 };
 
+// Internal reads use the cached config directly; callers only ever see the
+// frozen shared snapshot. readFromStorage already returns a normalized config.
+const loadCurrent = async (): Promise<RuntimeConfig> => {
+  if (!inMemoryCache) {
+    inMemoryCache = await readFromStorage();
+  }
+  return inMemoryCache;
+};
+
 export const UserConfig = {
   async snapshot(): Promise<RuntimeConfig> {
-    if (inMemoryCache) {
-      return cloneConfig(inMemoryCache);
-    }
-    const fromStorage = await readFromStorage();
-    inMemoryCache = normalizeRuntime(fromStorage);
-    return cloneConfig(inMemoryCache);
+    return snapshotOf(await loadCurrent());
   },
 
   async update(patch: Partial<RuntimeConfig>): Promise<void> {
-    const current = await this.snapshot();
+    const current = await loadCurrent();
     const next = mergeConfigs(current, patch);
     inMemoryCache = next;
     try {
@@ -200,7 +223,7 @@ export const UserConfig = {
         console.warn('[user-config] persist remote failed', error);
       }
       notifyListeners(runtime);
-      return cloneConfig(runtime);
+      return snapshotOf(runtime);
     } catch (error) {
       console.warn('[user-config] load remote failed', error);
       return this.snapshot();
@@ -211,7 +234,7 @@ export const UserConfig = {
     listeners.add(onChange);
     if (inMemoryCache) {
       try {
-        onChange(cloneConfig(inMemoryCache));
+        onChange(snapshotOf(inMemoryCache));
       } catch (error) {
         console.warn('[user-config] initial subscriber notify failed', error);
       }
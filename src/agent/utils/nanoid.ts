@@ -17,27 +17,41 @@ const resolveCrypto = (): Crypto | undefined => {
   return undefined
 }
 
-export const nanoid = (): string => {
-  const cryptoObj = resolveCrypto()
-  if (!cryptoObj) {
-    throw new Error('Secure random generation is not supported in this environment.')
-  }
+// Largest multiple of the alphabet length that fits in a byte; bytes at or
+// above it are rejected so every character stays equally likely.
+const limit = Math.floor(256 / alphabet.length) * alphabet.length
 
-  const result: string[] = []
-  const limit = Math.floor(256 / alphabet.length) * alphabet.length
+// Random bytes are drawn in one batch covering many ids and consumed across
+// calls, so most ids cost no getRandomValues call at all.
+const POOL_SIZE = size * 16
+let pool: Uint8Array | null = null
+let poolOffset = POOL_SIZE
+let cryptoObj: Crypto | undefined
 
-  const randomBytes = new Uint8Array(size * 2)
-  while (result.length < size) {
-    cryptoObj.getRandomValues(randomBytes)
-    for (let i = 0; i < randomBytes.length && result.length < size; i += 1) {
-      const randomByte = randomBytes[i]
-      if (randomByte >= limit) {
-        continue
+const nextByte = (): number => {
+  if (poolOffset >= POOL_SIZE) {
+    if (!cryptoObj) {
+      cryptoObj = resolveCrypto()
+      if (!cryptoObj) {
+        throw new Error('Secure random generation is not supported in this environment.')
       }
-      const index = randomByte % alphabet.length
-      result.push(alphabet.charAt(index))
     }
+    pool ??= new Uint8Array(POOL_SIZE)
+    cryptoObj.getRandomValues(pool)
+    poolOffset = 0
   }
+  const byte = pool![poolOffset]!
+  poolOffset += 1
+  return byte
+}
 
-  return result.join('')
+export const nanoid = (): string => {
+  let result = ''
+  while (result.length < size) {
+    const randomByte = nextByte()
+    if (randomByte < limit) {
+      result += alphabet.charAt(randomByte % alphabet.length)
+    }
+  }
+  return result
 }
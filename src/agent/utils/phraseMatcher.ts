@@ -0,0 +1,113 @@
+// Aho-Corasick automaton over fixed phrase lists. Every phrase carries the
+// bit flag of the list it came from, and scan() walks the text once, ORing
+// the flags of every phrase that occurs anywhere in it. Matching is plain
+// substring semantics (overlaps included), identical to checking
+// `text.includes(phrase)` for each phrase, but in a single pass.
+//
+// The automaton is compiled into a dense DFA: characters are mapped to a
+// small set of classes (one per distinct phrase character, plus "other"),
+// and every state has a precomputed transition for every class, so a scan is
+// one table lookup per character with no failure-link walking.
+
+export interface PhraseMatcher {
+  scan(text: string): number
+}
+
+const ASCII_LIMIT = 128
+
+export const createPhraseMatcher = (
+  groups: ReadonlyArray<readonly [bit: number, phrases: readonly string[]]>
+): PhraseMatcher => {
+  // Class 0 is every character that appears in no phrase.
+  const classByCode = new Map<number, number>()
+  for (const [, phrases] of groups) {
+    for (const phrase of phrases) {
+      for (let i = 0; i < phrase.length; i += 1) {
+        const code = phrase.charCodeAt(i)
+        if (!classByCode.has(code)) {
+          classByCode.set(code, classByCode.size + 1)
+        }
+      }
+    }
+  }
+  const classCount = classByCode.size + 1
+  const asciiClass = new Uint8Array(ASCII_LIMIT)
+  classByCode.forEach((cls, code) => {
+    if (code < ASCII_LIMIT) asciiClass[code] = cls
+  })
+  const classOf = (code: number): number =>
+    code < ASCII_LIMIT ? asciiClass[code]! : classByCode.get(code) ?? 0
+
+  // Trie over character classes; -1 marks a missing edge.
+  const trie: number[][] = [new Array<number>(classCount).fill(-1)]
+  const output: number[] = [0]
+  let allBits = 0
+
+  for (const [bit, phrases] of groups) {
+    allBits |= bit
+    for (const phrase of phrases) {
+      let state = 0
+      for (let i = 0; i < phrase.length; i += 1) {
+        const cls = classOf(phrase.charCodeAt(i))
+        let next = trie[state]![cls]!
+        if (next === -1) {
+          next = trie.length
+          trie.push(new Array<number>(classCount).fill(-1))
+          output.push(0)
+          trie[state]![cls] = next
+        }
+        state = next
+      }
+      output[state]! |= bit
+    }
+  }
+
+  // Breadth-first construction of the full transition table. A missing edge
+  // takes the transition of the state's failure link, and each state
+  // inherits the output of its longest proper suffix, so a scan never has to
+  // walk the fail chain to follow edges or report matches.
+  const stateCount = trie.length
+  const delta = new Int32Array(stateCount * classCount)
+  const outputs = new Int32Array(stateCount)
+  const fail = new Int32Array(stateCount)
+  const queue: number[] = []
+
+  for (let cls = 0; cls < classCount; cls += 1) {
+    const child = trie[0]![cls]!
+    if (child > 0) {
+      delta[cls] = child
+      queue.push(child)
+    }
+  }
+  outputs[0] = output[0]!
+
+  for (let head = 0; head < queue.length; head += 1) {
+    const state = queue[head]!
+    outputs[state] = output[state]! | outputs[fail[state]!]!
+    const row = state * classCount
+    const failRow = fail[state]! * classCount
+    for (let cls = 0; cls < classCount; cls += 1) {
+      const child = trie[state]![cls]!
+      if (child === -1) {
+        delta[row + cls] = delta[failRow + cls]!
+      } else {
+        delta[row + cls] = child
+        fail[child] = delta[failRow + cls]!
+        queue.push(child)
+      }
+    }
+  }
+
+  return {
+    scan(text: string): number {
+      let state = 0
+      let bits = 0
+      for (let i = 0; i < text.length; i += 1) {
+        state = delta[state * classCount + classOf(text.charCodeAt(i))]!
+        bits |= outputs[state]!
+        if (bits === allBits) break
+      }
+      return bits
+    },
+  }
+}
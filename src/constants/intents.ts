@@ -72,11 +72,11 @@ const definitions: IntentDefinition[] = [
   },
 ];
 
-const lookup = new Map(
+const lookup: ReadonlyMap<string, IntentDefinition> = new Map(
   definitions.map((definition) => [definition.label.toLowerCase(), definition])
 );
 
-const byId = new Map(definitions.map((definition) => [definition.id, definition]));
+const byId: ReadonlyMap<AppIntent, IntentDefinition> = new Map(definitions.map((definition) => [definition.id, definition]));
 
 const DEFAULT_INTENT: IntentDefinition = {
   id: "conversational",
@@ -111,8 +111,10 @@ export function getIntentById(intent: AppIntent): IntentDefinition {
   };
 }
 
-export const entryChatAllowedIntents = definitions
-  .filter((definition) => definition.allowedInEntryChat)
-  .map((definition) => definition.id);
+export const entryChatAllowedIntents: ReadonlySet<AppIntent> = new Set(
+  definitions
+    .filter((definition) => definition.allowedInEntryChat)
+    .map((definition) => definition.id)
+);
 
-export const allIntentDefinitions = definitions;
+export const allIntentDefinitions: readonly IntentDefinition[] = definitions;
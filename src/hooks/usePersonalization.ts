@@ -19,11 +19,11 @@ export const usePersonalization = (): UsePersonalizationResult => {
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState<string | null>(null)
 
-  const load = useCallback(async () => {
+  const load = useCallback(async (force = false) => {
     setLoading(true)
     setError(null)
     try {
-      const bundle = await fetchPersonalizationBundle()
+      const bundle = await fetchPersonalizationBundle(undefined, { force })
       setData(bundle)
     } catch (err) {
       console.error('Failed to load personalization bundle', err)
@@ -52,7 +52,7 @@ export const usePersonalization = (): UsePersonalizationResult => {
   )
 
   const refresh = useCallback(async () => {
-    await load()
+    await load(true)
   }, [load])
 
   return {
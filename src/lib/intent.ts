@@ -38,7 +38,7 @@ export function buildPredictionFromNative(
 }
 
 export function isEntryChatAllowed(intent: AppIntent): boolean {
-  return entryChatAllowedIntents.includes(intent);
+  return entryChatAllowedIntents.has(intent);
 }
 
 export function mapIntentToEntryType(intent: AppIntent): EntryType {
@@ -6,6 +6,7 @@ import type {
 } from "../types/intent";
 import type { EnrichedPayload, PlannerResponse } from "@/agent/types";
 import { recordAiEvent } from "./riflettSpine";
+import { memoize } from "@/utils/lru";
 import { gateRequest, type GateResult } from "../../services/ai/gate";
 import { understand, reason } from "../../services/ai/pipeline";
 import {
@@ -81,6 +82,71 @@ function buildContext(entryContent: string, annotations: Annotation[]): string {
   ].join("\n\n");
 }
 
+type PipelineContext = {
+  annotations: Annotation[];
+  entryContent: string;
+  entryType: string;
+};
+
+/**
+ * Gate the request and, off the fast path, run understand → reason.
+ * understand() does not depend on the gate, so it starts alongside it and
+ * its result is simply dropped when the fast path is taken. Never rejects.
+ */
+async function planRequest(
+  userMessage: string,
+  pipelineContext: PipelineContext
+): Promise<{ gateResult: GateResult | null; planMetadata: PlanMetadata }> {
+  let gateResult: GateResult | null = null;
+  let planMetadata: PlanMetadata = {
+    steps: [],
+    confidence: null,
+    route: "gpt_thinking",
+    reason: "",
+  };
+
+  const understanding = understand({ userMessage, context: pipelineContext });
+  // Handled below when the result is used; otherwise intentionally ignored.
+  understanding.catch(() => undefined);
+
+  try {
+    gateResult = await gateRequest({ userMessage, context: pipelineContext });
+    planMetadata = {
+      steps:
+        gateResult.route === "fast_path"
+          ? ["Fast path heuristics handled this directly."]
+          : [],
+      confidence: gateResult.confidence,
+      route: gateResult.route,
+      reason: gateResult.reason,
+    };
+  } catch (gateError) {
+    console.warn("[generateAIResponse] gateRequest failed", gateError);
+  }
+
+  if (gateResult?.route !== "fast_path") {
+    try {
+      const understandResult = await understanding;
+      const reasonResult = await reason({
+        understandOutput: understandResult,
+        context: pipelineContext,
+      });
+      planMetadata = {
+        ...planMetadata,
+        steps: reasonResult.plan.steps.slice(0, 4),
+        confidence: reasonResult.confidence,
+      };
+    } catch (pipelineError) {
+      console.warn(
+        "[generateAIResponse] pipeline reasoning failed",
+        pipelineError
+      );
+    }
+  }
+
+  return { gateResult, planMetadata };
+}
+
 /** Main call: uses Chat Completions + tool/function calling for strict JSON */
 export async function generateAIResponse(params: {
   apiKey?: string;
@@ -132,62 +198,15 @@ ${context}
 
 New user request: ${params.userMessage}${lessonsBlock}`;
 
-  const pipelineContext = {
+  const pipelineContext: PipelineContext = {
     annotations: params.annotations,
     entryContent: params.entryContent,
     entryType: params.entryType,
   };
 
-  let gateResult: GateResult | null = null;
-  let planMetadata: PlanMetadata = {
-    steps: [],
-    confidence: null,
-    route: "gpt_thinking",
-    reason: "",
-  };
-
-  try {
-    gateResult = await gateRequest({
-      userMessage: params.userMessage,
-      context: pipelineContext,
-    });
-    planMetadata = {
-      steps:
-        gateResult.route === "fast_path"
-          ? ["Fast path heuristics handled this directly."]
-          : [],
-      confidence: gateResult.confidence,
-      route: gateResult.route,
-      reason: gateResult.reason,
-    };
-  } catch (gateError) {
-    console.warn("[generateAIResponse] gateRequest failed", gateError);
-  }
-
-  const personaProfile = resolvePersona(gateResult?.intent);
-
-  if (gateResult?.route !== "fast_path") {
-    try {
-      const understandResult = await understand({
-        userMessage: params.userMessage,
-        context: pipelineContext,
-      });
-      const reasonResult = await reason({
-        understandOutput: understandResult,
-        context: pipelineContext,
-      });
-      planMetadata = {
-        ...planMetadata,
-        steps: reasonResult.plan.steps.slice(0, 4),
-        confidence: reasonResult.confidence,
-      };
-    } catch (pipelineError) {
-      console.warn(
-        "[generateAIResponse] pipeline reasoning failed",
-        pipelineError
-      );
-    }
-  }
+  // Gating and planning only feed the metadata recorded after the model
+  // call, so they run while the OpenAI request is in flight.
+  const planning = planRequest(params.userMessage, pipelineContext);
 
   // Define a single function/tool that encodes the schema we want back
   const tools = [
@@ -301,6 +320,9 @@ New user request: ${params.userMessage}${lessonsBlock}`;
 
   validateAIResponse(rawResponse);
 
+  const { gateResult, planMetadata } = await planning;
+  const personaProfile = resolvePersona(gateResult?.intent);
+
   const latencyMs = Math.max(0, Math.round(Date.now() - startedAt));
   const truncatedInput =
     typeof params.userMessage === "string"
@@ -577,14 +599,18 @@ function validateEntryNote(payload: any): asserts payload is EntryNotePayload {
   }
 }
 
-function sanitizeTag(tag: string): string {
-  return tag
-    .toLowerCase()
-    .replace(/[^a-z0-9]+/g, "-")
-    .replace(/-{2,}/g, "-")
-    .replace(/^-+|-+$/g, "")
-    .slice(0, 60);
-}
+// Tags are mostly intent ids and model-suggested labels drawn from a small
+// vocabulary, so results are memoized rather than re-running four regexes.
+const sanitizeTag = memoize(
+  (tag: string): string =>
+    tag
+      .toLowerCase()
+      .replace(/[^a-z0-9]+/g, "-")
+      .replace(/-{2,}/g, "-")
+      .replace(/^-+|-+$/g, "")
+      .slice(0, 60),
+  256
+);
 
 export function formatAnnotationLabel(channel: AnnotationChannel): string {
   switch (channel) {
@@ -75,6 +75,15 @@ export function inferLikelyNeed(
   return "context_refresh";
 }
 
+const MAX_MODES = 6;
+
+const outranksMode = (
+  candidate: { count: number; lastSeen: string },
+  other: { count: number; last_seen_at: string }
+): boolean =>
+  candidate.count > other.count ||
+  (candidate.count === other.count && candidate.lastSeen.localeCompare(other.last_seen_at) > 0);
+
 export function aggregateModes(entries: ModeSample[]) {
   const counts = new Map<string, { count: number; lastSeen: string }>();
   for (const entry of entries) {
@@ -91,16 +100,26 @@ export function aggregateModes(entries: ModeSample[]) {
     }
   }
 
-  return Array.from(counts.entries())
-    .map(([label, value]) => ({
-      label,
-      count: value.count,
-      last_seen_at: value.lastSeen,
-    }))
-    .sort((a, b) => b.count - a.count || b.last_seen_at.localeCompare(a.last_seen_at))
-    .slice(0, 6);
+  // Keep the top MAX_MODES in a small sorted buffer rather than sorting every
+  // distinct mood; ties keep first-seen order, as the stable sort did.
+  const top: Array<{ label: string; count: number; last_seen_at: string }> = [];
+  for (const [label, value] of counts) {
+    let position = top.length;
+    while (position > 0 && outranksMode(value, top[position - 1]!)) {
+      position -= 1;
+    }
+    if (position >= MAX_MODES) continue;
+    top.splice(position, 0, { label, count: value.count, last_seen_at: value.lastSeen });
+    if (top.length > MAX_MODES) {
+      top.pop();
+    }
+  }
+  return top;
 }
 
+const MAX_EVIDENCE_NODES = 20;
+const MAX_EVIDENCE_SOURCES = 5;
+
 export function buildEvidence(
   matches: MemoryMatchInput[],
   edgeRows: MemoryEdgeInput[],
@@ -108,18 +127,34 @@ export function buildEvidence(
   includeFatigue: MemoryNodeInput[],
   threshold = 0.4
 ): EvidenceNode[] {
-  const evidence = new Map<
-    string,
-    {
-      id: string;
-      type: MemoryNodeType;
-      text: string;
-      strength: number;
-      trust_weight: number;
-      sentiment: number | null;
-      sources: Set<string>;
+  // Evidence is kept as parallel arrays indexed by slot, so reinforcing a
+  // node is one map lookup plus in-place updates. Only the first
+  // MAX_EVIDENCE_SOURCES distinct sources are ever emitted, so no more are
+  // kept and no per-node Set is needed.
+  const slotOf = new Map<string, number>();
+  const nodes: MemoryNodeInput[] = [];
+  const strengths: number[] = [];
+  const sources: string[][] = [];
+
+  const reinforce = (id: string, strength: number, source: string): boolean => {
+    const slot = slotOf.get(id);
+    if (slot === undefined) return false;
+    if (strengths[slot]! < strength) {
+      strengths[slot] = strength;
+    }
+    const nodeSources = sources[slot]!;
+    if (nodeSources.length < MAX_EVIDENCE_SOURCES && !nodeSources.includes(source)) {
+      nodeSources.push(source);
     }
-  >();
+    return true;
+  };
+
+  const register = (node: MemoryNodeInput, strength: number, source: string) => {
+    slotOf.set(node.id, nodes.length);
+    nodes.push(node);
+    strengths.push(strength);
+    sources.push([source]);
+  };
 
   const addEvidence = (
     node: MemoryNodeInput,
@@ -127,27 +162,17 @@ export function buildEvidence(
     source: string
   ) => {
     if (!node || strength < threshold) return;
-    const existing = evidence.get(node.id);
-    if (existing) {
-      if (existing.strength < strength) {
-        existing.strength = strength;
-      }
-      existing.sources.add(source);
-    } else {
-      evidence.set(node.id, {
-        id: node.id,
-        type: node.type,
-        text: node.text,
-        strength,
-        trust_weight: node.trust_weight,
-        sentiment: node.sentiment,
-        sources: new Set([source]),
-      });
+    if (!reinforce(node.id, strength, source)) {
+      register(node, strength, source);
     }
   };
 
   for (const match of matches) {
-    addEvidence(
+    const strength = match.score * match.trust_weight;
+    if (strength < threshold || reinforce(match.node_id, strength, "vector_match")) {
+      continue;
+    }
+    register(
       {
         id: match.node_id,
         type: match.node_type,
@@ -155,7 +180,7 @@ export function buildEvidence(
         trust_weight: match.trust_weight,
         sentiment: match.sentiment,
       },
-      match.score * match.trust_weight,
+      strength,
       "vector_match"
     );
   }
@@ -165,27 +190,45 @@ export function buildEvidence(
     const target = neighborNodes.get(edge.dst_id);
     if (!source || !target) continue;
 
-    const forwardStrength = edge.weight * target.trust_weight;
-    addEvidence(target, forwardStrength, `edge:${edge.relation}`);
-
-    const reverseStrength = edge.weight * source.trust_weight;
-    addEvidence(source, reverseStrength, `edge:${edge.relation}`);
+    const edgeSource = `edge:${edge.relation}`;
+    addEvidence(target, edge.weight * target.trust_weight, edgeSource);
+    addEvidence(source, edge.weight * source.trust_weight, edgeSource);
   }
 
   for (const node of includeFatigue) {
     addEvidence(node, Math.min(0.9, node.trust_weight), "fatigue_recall");
   }
 
-  return Array.from(evidence.values())
-    .map((item) => ({
-      id: item.id,
-      type: item.type,
-      text: item.text,
-      strength: Number(item.strength.toFixed(3)),
-      trust_weight: Number(item.trust_weight.toFixed(3)),
-      sentiment: item.sentiment,
-      sources: Array.from(item.sources).slice(0, 5),
-    }))
-    .sort((a, b) => b.strength - a.strength)
-    .slice(0, 20);
+  // Keep the strongest MAX_EVIDENCE_NODES in a small sorted buffer instead
+  // of sorting every node. Ranking uses the rounded strength that is
+  // emitted, and ties keep first-seen order, as the stable sort did.
+  const top: Array<{ slot: number; strength: number }> = [];
+  for (let slot = 0; slot < nodes.length; slot += 1) {
+    const strength = Number(strengths[slot]!.toFixed(3));
+    const floor = top[top.length - 1];
+    if (top.length >= MAX_EVIDENCE_NODES && floor && strength <= floor.strength) {
+      continue;
+    }
+    let position = top.length;
+    while (position > 0 && top[position - 1]!.strength < strength) {
+      position -= 1;
+    }
+    top.splice(position, 0, { slot, strength });
+    if (top.length > MAX_EVIDENCE_NODES) {
+      top.pop();
+    }
+  }
+
+  return top.map(({ slot, strength }) => {
+    const node = nodes[slot]!;
+    return {
+      id: node.id,
+      type: node.type,
+      text: node.text,
+      strength,
+      trust_weight: Number(node.trust_weight.toFixed(3)),
+      sentiment: node.sentiment,
+      sources: sources[slot]!,
+    };
+  });
 }
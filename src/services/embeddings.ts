@@ -6,13 +6,128 @@ import type {
   SimilarEntry,
 } from '../types/mvp'
 import { isUUID } from '../utils/uuid'
+import { retryWithBackoff } from '../utils/retry'
 
 const EMBEDDING_MODEL = 'text-embedding-3-small'
 
+// Caps embedding requests in flight across the app so bulk work (backfills,
+// similarity searches fired together) queues locally instead of tripping
+// OpenAI rate limits. Rate-limited and transient failures are retried with
+// jittered backoff while the slot is held, which also slows the caller down.
+const EMBEDDING_MAX_CONCURRENCY = 8
+const EMBEDDING_RETRIES = 3
+
+let activeEmbeddingRequests = 0
+const embeddingWaiters: Array<() => void> = []
+
+async function withEmbeddingSlot<T>(task: () => Promise<T>): Promise<T> {
+  if (activeEmbeddingRequests < EMBEDDING_MAX_CONCURRENCY) {
+    activeEmbeddingRequests += 1
+  } else {
+    // The finishing request hands its slot over directly (see below).
+    await new Promise<void>((resolve) => embeddingWaiters.push(resolve))
+  }
+  try {
+    return await task()
+  } finally {
+    const next = embeddingWaiters.shift()
+    if (next) {
+      next()
+    } else {
+      activeEmbeddingRequests -= 1
+    }
+  }
+}
+
+class EmbeddingRequestError extends Error {
+  readonly status: number
+
+  constructor(message: string, status: number) {
+    super(message)
+    this.name = 'EmbeddingRequestError'
+    this.status = status
+  }
+}
+
+// 429s, 5xx responses and network failures (fetch rejects with a TypeError)
+// are worth another attempt; auth errors, bad input and timeouts are not.
+const isRetryableEmbeddingError = (error: unknown): boolean =>
+  error instanceof EmbeddingRequestError
+    ? error.status === 429 || error.status >= 500
+    : error instanceof TypeError
+
+// Only a rejected input (bad request or payload too large) can be specific
+// to one text in a batch; auth failures, timeouts and malformed responses
+// would fail the same way for every text on its own.
+const isBadEmbeddingInputError = (error: unknown): boolean =>
+  error instanceof EmbeddingRequestError && (error.status === 400 || error.status === 413)
+
+// Concurrent callers are coalesced into one batched embeddings request:
+// texts queue for up to EMBEDDING_BATCH_WINDOW_MS (or until a batch fills)
+// and each caller's promise resolves with its own row of the response.
+const EMBEDDING_BATCH_SIZE = 64
+const EMBEDDING_BATCH_WINDOW_MS = 10
+
+interface PendingEmbedding {
+  text: string
+  resolve: (embedding: number[]) => void
+  reject: (error: unknown) => void
+}
+
+let pendingEmbeddings: PendingEmbedding[] = []
+let embeddingFlushTimer: ReturnType<typeof setTimeout> | null = null
+
 /**
  * Generate an embedding for a given text using OpenAI
  */
-export async function generateEmbedding(text: string): Promise<number[]> {
+export function generateEmbedding(text: string): Promise<number[]> {
+  return new Promise<number[]>((resolve, reject) => {
+    pendingEmbeddings.push({ text, resolve, reject })
+    if (pendingEmbeddings.length >= EMBEDDING_BATCH_SIZE) {
+      flushPendingEmbeddings()
+    } else if (!embeddingFlushTimer) {
+      embeddingFlushTimer = setTimeout(flushPendingEmbeddings, EMBEDDING_BATCH_WINDOW_MS)
+    }
+  })
+}
+
+function flushPendingEmbeddings(): void {
+  if (embeddingFlushTimer) {
+    clearTimeout(embeddingFlushTimer)
+    embeddingFlushTimer = null
+  }
+  const batch = pendingEmbeddings
+  pendingEmbeddings = []
+  if (batch.length > 0) {
+    void settleEmbeddingBatch(batch)
+  }
+}
+
+async function settleEmbeddingBatch(batch: PendingEmbedding[]): Promise<void> {
+  try {
+    const embeddings = await embedTexts(batch.map((pending) => pending.text))
+    batch.forEach((pending, index) => pending.resolve(embeddings[index]!))
+  } catch (error) {
+    if (batch.length > 1 && isBadEmbeddingInputError(error)) {
+      // One unembeddable text (e.g. over the token limit) should not fail
+      // the unrelated callers it happened to be batched with.
+      await Promise.all(batch.map((pending) => settleEmbeddingBatch([pending])))
+      return
+    }
+    batch.forEach((pending) => pending.reject(error))
+  }
+}
+
+function embedTexts(texts: string[]): Promise<number[][]> {
+  return withEmbeddingSlot(() =>
+    retryWithBackoff(() => requestEmbeddings(texts), {
+      retries: EMBEDDING_RETRIES,
+      shouldRetry: isRetryableEmbeddingError,
+    })
+  )
+}
+
+async function requestEmbeddings(texts: string[]): Promise<number[][]> {
   const apiKey = resolveOpenAIApiKey()
   const ctrl = new AbortController()
   const timeout = setTimeout(() => ctrl.abort(), 30000)
@@ -26,7 +141,7 @@ export async function generateEmbedding(text: string): Promise<number[]> {
       },
       body: JSON.stringify({
         model: EMBEDDING_MODEL,
-        input: text,
+        input: texts,
       }),
       signal: ctrl.signal,
     })
@@ -34,17 +149,38 @@ export async function generateEmbedding(text: string): Promise<number[]> {
     if (!response.ok) {
       const errorBody = await response.text().catch(() => '')
       console.warn('[OpenAI Embeddings] Error:', response.status, errorBody)
-      throw new Error('Failed to generate embedding')
+      throw new EmbeddingRequestError('Failed to generate embedding', response.status)
     }
 
     const data = await response.json()
-    const embedding = data?.data?.[0]?.embedding
-
-    if (!Array.isArray(embedding) || embedding.length === 0) {
+    const rows: unknown = data?.data
+    if (!Array.isArray(rows) || rows.length !== texts.length) {
       throw new Error('Invalid embedding response from OpenAI')
     }
 
-    return embedding
+    // Rows carry the index of the input they embed.
+    const embeddings = new Array<number[]>(texts.length)
+    for (const row of rows) {
+      const index = row?.index
+      const embedding = row?.embedding
+      if (
+        typeof index !== 'number' ||
+        index < 0 ||
+        index >= texts.length ||
+        !Array.isArray(embedding) ||
+        embedding.length === 0
+      ) {
+        throw new Error('Invalid embedding response from OpenAI')
+      }
+      embeddings[index] = embedding
+    }
+    for (let i = 0; i < embeddings.length; i += 1) {
+      if (!embeddings[i]) {
+        throw new Error('Invalid embedding response from OpenAI')
+      }
+    }
+
+    return embeddings
   } catch (error: any) {
     if (error?.name === 'AbortError') {
       throw new Error('Embedding request timed out')
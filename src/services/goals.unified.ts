@@ -81,6 +81,41 @@ function cosineSimilarity(a: number[], b: number[]): number {
   return dot / (Math.sqrt(magA) * Math.sqrt(magB))
 }
 
+// Dedupe scores one candidate against every existing goal, so the candidate
+// is packed into a typed array with its magnitude computed once; each
+// comparison then only accumulates the dot product and the other magnitude.
+interface PreparedVector {
+  values: Float64Array
+  magnitude: number
+}
+
+function prepareVector(vector: number[]): PreparedVector {
+  const values = Float64Array.from(vector)
+  let sumSquares = 0
+  for (let index = 0; index < values.length; index += 1) {
+    sumSquares += values[index]! * values[index]!
+  }
+  return { values, magnitude: Math.sqrt(sumSquares) }
+}
+
+function preparedCosineSimilarity(prepared: PreparedVector, other: number[]): number {
+  const { values, magnitude } = prepared
+  if (values.length !== other.length) {
+    // Mismatched dimensions compare over the shared prefix only.
+    return cosineSimilarity(Array.from(values), other)
+  }
+  if (values.length === 0 || magnitude === 0) return 0
+  let dot = 0
+  let magB = 0
+  for (let index = 0; index < values.length; index += 1) {
+    const y = other[index] ?? 0
+    dot += values[index]! * y
+    magB += y * y
+  }
+  if (magB === 0) return 0
+  return dot / (magnitude * Math.sqrt(magB))
+}
+
 function asVector(value: unknown): number[] | null {
   if (!value) return null
   if (Array.isArray(value)) {
@@ -355,12 +390,13 @@ async function applyDedupe(
   const dedupeThreshold = getDedupeThreshold() || DEFAULT_DEDUPE_THRESHOLD
   const existingGoals = await fetchExistingGoals(userId)
   const normalizedTitle = normalizeTitle(payload.title)
+  const candidate = prepareVector(candidateEmbedding)
 
   for (const goal of existingGoals) {
     const existingEmbedding = asVector((goal as any).embedding)
     if (!existingEmbedding) continue
 
-    const similarity = cosineSimilarity(candidateEmbedding, existingEmbedding)
+    const similarity = preparedCosineSimilarity(candidate, existingEmbedding)
     if (similarity < dedupeThreshold) continue
 
     const sameCategory =
@@ -16,32 +16,34 @@ const dna = {
     "You are an organized scheduler who helps with time management, priorities, and balancing energy across commitments.",
 } as const;
 
-export const personaCatalog: Record<PersonaProfile["name"], PersonaProfile> = {
-  coach: {
+// resolvePersona hands out these shared profiles on every AI request without
+// copying, so they are frozen to keep a caller from mutating the catalog.
+export const personaCatalog: Record<PersonaProfile["name"], PersonaProfile> = Object.freeze({
+  coach: Object.freeze({
     name: "coach",
     tone: "warm, supportive, motivational",
     dna: dna.coach,
     summary: "Coaching voice—builds momentum with supportive nudges.",
-  },
-  analyst: {
+  }),
+  analyst: Object.freeze({
     name: "analyst",
     tone: "analytical, objective, insightful",
     dna: dna.analyst,
     summary: "Insight analyst—connects dots and challenges blind spots.",
-  },
-  mirror: {
+  }),
+  mirror: Object.freeze({
     name: "mirror",
     tone: "calm, validating, introspective",
     dna: dna.mirror,
     summary: "Reflective mirror—holds space and reflects language back.",
-  },
-  scheduler: {
+  }),
+  scheduler: Object.freeze({
     name: "scheduler",
     tone: "organized, practical, efficient",
     dna: dna.scheduler,
     summary: "Planning partner—structures time and commitments clearly.",
-  },
-};
+  }),
+});
 
 export type PersonaName = keyof typeof personaCatalog;
 
@@ -21,6 +21,8 @@ const CACHE_KEY = "@reflectify:user_settings";
 const PRIVACY_GATES_FEATURE_KEY = "privacy_gates";
 const CRISIS_RULES_FEATURE_KEY = "crisis_rules";
 
+const BUNDLE_CACHE_TTL_MS = 30 * 1000;
+
 const DEFAULT_PRIVACY_GATES: PrivacyGateMap = {};
 const DEFAULT_CRISIS_RULES: Record<string, unknown> = {};
 
@@ -287,9 +289,58 @@ const fetchSettings = async (userId: string): Promise<UserSettings | null> => {
   return data as UserSettings;
 };
 
+interface BundleCacheEntry {
+  userId: string;
+  version: number;
+  expiresAt: number;
+  bundle: PersonalizationBundle;
+}
+
+// Bumped after every local settings write so a bundle resolved before the
+// write is neither served nor stored once it lands.
+let settingsVersion = 0;
+let bundleCache: BundleCacheEntry | null = null;
+
+const invalidateBundleCache = () => {
+  settingsVersion += 1;
+  bundleCache = null;
+};
+
+// Callers get their own copy, so mutating a returned bundle can never leak
+// into the cached one. Bundles are plain JSON rows and small.
+const copyBundle = (bundle: PersonalizationBundle): PersonalizationBundle =>
+  JSON.parse(JSON.stringify(bundle)) as PersonalizationBundle;
+
+const readCachedBundle = (userId: string): PersonalizationBundle | null => {
+  if (
+    bundleCache &&
+    bundleCache.userId === userId &&
+    bundleCache.version === settingsVersion &&
+    bundleCache.expiresAt > Date.now()
+  ) {
+    return copyBundle(bundleCache.bundle);
+  }
+  return null;
+};
+
+/**
+ * Resolves the profile, settings and feature flags for a user. Results are
+ * cached briefly; pass `force` (e.g. for a manual refresh) to skip the cache
+ * and pick up changes made on another device or server-side.
+ */
 export const fetchPersonalizationBundle = async (
-  uid?: string
+  uid?: string,
+  options: { force?: boolean } = {}
 ): Promise<PersonalizationBundle | null> => {
+  const version = settingsVersion;
+  const force = options.force === true;
+  if (uid && !force) {
+    const cached = readCachedBundle(uid);
+    if (cached) {
+      return cached;
+    }
+  }
+
   const {
     data: { user },
     error: authError,
@@ -304,6 +355,13 @@ export const fetchPersonalizationBundle = async (
     return null;
   }
 
+  if (!uid && !force) {
+    const cached = readCachedBundle(userId);
+    if (cached) {
+      return cached;
+    }
+  }
+
   const [profile, cachedSettings, remoteSettings, featureMap] =
     await Promise.all([
       fetchProfile(userId, user ?? null),
@@ -338,11 +396,23 @@ export const fetchPersonalizationBundle = async (
 
   const runtime = buildRuntimePreferences(resolvedSettings, featureMap);
 
-  return {
+  const bundle: PersonalizationBundle = {
     ...runtime,
     profile,
     settings: resolvedSettings,
   };
+
+  if (version === settingsVersion) {
+    bundleCache = {
+      userId,
+      version,
+      expiresAt: Date.now() + BUNDLE_CACHE_TTL_MS,
+      bundle,
+    };
+    return copyBundle(bundle);
+  }
+
+  return bundle;
 };
 
 interface PersistOptions {
@@ -383,6 +453,7 @@ export const persistPersonalization = async (
     console.error("Failed to upsert user settings", settingsError);
     throw settingsError;
   }
+  invalidateBundleCache();
 
   const profileUpdatePayload: Record<string, any> = {
     timezone: options.profileTimezone,
@@ -417,6 +488,7 @@ export const persistPersonalization = async (
   }
 
   await storeCachedSettings(payload);
+  invalidateBundleCache();
 
   const signal: PersonaSignalPayload = {
     source: options.source,
@@ -486,6 +558,7 @@ export const updateNotificationPreferences = async (prefs: {
   if (error) {
     throw error;
   }
+  invalidateBundleCache();
 
   const cached = await loadCachedSettings();
   if (cached) {
@@ -511,6 +584,7 @@ export const resetPersonalization = async () => {
     if (!user) return;
     await supabase.from("user_settings").delete().eq("user_id", user.id);
     await AsyncStorage.removeItem(CACHE_KEY);
+    invalidateBundleCache();
   } catch (error) {
     console.error("Failed to reset personalization data", error);
   }
@@ -529,6 +603,7 @@ export const deletePersonalization = async () => {
       .update({ onboarding_completed: false })
       .eq("id", user.id);
     await AsyncStorage.removeItem(CACHE_KEY);
+    invalidateBundleCache();
   } catch (error) {
     console.error("Failed to delete personalization data", error);
   }
@@ -28,7 +28,10 @@ export interface PersistedScheduleBlock {
   updated_at: string
 }
 
-interface ScheduleBlockInput {
+export const DEFAULT_BLOCK_INTENT = 'focus.block'
+export const GOAL_BLOCK_INTENT = 'goal.focus'
+
+export interface ScheduleBlockInput {
   start: string
   end: string
   intent: string
@@ -70,19 +73,39 @@ const resolveUserId = async (uid?: string | null): Promise<string> => {
 
 const toISOString = (value: Date): string => value.toISOString()
 
-const hasConflict = (
-  start: Date,
-  end: Date,
+const SUGGESTION_DAYS = 5
+const SUGGESTION_HOURS = [9, 13, 16] as const
+const MAX_CANDIDATE_STARTS = 6
+
+// Flattened (dayOffset, hour) grid scanned in order by suggestBlocks.
+const CANDIDATE_SLOTS: ReadonlyArray<readonly [number, number]> = Array.from(
+  { length: SUGGESTION_DAYS * SUGGESTION_HOURS.length },
+  (_, index) =>
+    [
+      Math.floor(index / SUGGESTION_HOURS.length),
+      SUGGESTION_HOURS[index % SUGGESTION_HOURS.length]!,
+    ] as const
+)
+
+interface BusyInterval {
+  startMs: number
+  endMs: number
+}
+
+// Parse stored ISO bounds once per request so conflict checks compare numbers.
+const toBusyIntervals = (
   existing: Array<{ start_at: string; end_at: string | null }>
-): boolean => {
-  const startMs = start.getTime()
-  const endMs = end.getTime()
-  return existing.some((block) => {
-    const blockStart = new Date(block.start_at).getTime()
-    const blockEnd = block.end_at ? new Date(block.end_at).getTime() : blockStart
-    return startMs < blockEnd && endMs > blockStart
+): BusyInterval[] =>
+  existing.map((block) => {
+    const startMs = Date.parse(block.start_at)
+    return {
+      startMs,
+      endMs: block.end_at ? Date.parse(block.end_at) : startMs,
+    }
   })
-}
+
+const hasConflict = (startMs: number, endMs: number, busy: BusyInterval[]): boolean =>
+  busy.some((block) => startMs < block.endMs && endMs > block.startMs)
 
 export async function persistScheduleBlock(
   uid: string | null,
@@ -158,7 +181,7 @@ export async function suggestBlocks(
     console.warn('[schedules] existing schedule lookup failed', existingError)
   }
 
-  const existing = existingRows ?? []
+  const busy = toBusyIntervals(existingRows ?? [])
   const suggestions: SuggestedBlock[] = []
 
   const candidateStarts: Date[] = []
@@ -166,44 +189,43 @@ export async function suggestBlocks(
   base.setMinutes(0, 0, 0)
   base.setHours(base.getHours() + 1)
 
-  for (let day = 0; day < 5 && candidateStarts.length < 6; day += 1) {
-    for (const hour of [9, 13, 16]) {
-      const candidate = new Date(base)
-      candidate.setDate(base.getDate() + day)
-      candidate.setHours(hour, 0, 0, 0)
-      if (candidate <= now) {
-        continue
-      }
-      candidateStarts.push(candidate)
-      if (candidateStarts.length >= 6) {
-        break
-      }
+  for (const [day, hour] of CANDIDATE_SLOTS) {
+    const candidate = new Date(base)
+    candidate.setDate(base.getDate() + day)
+    candidate.setHours(hour, 0, 0, 0)
+    if (candidate <= now) {
+      continue
+    }
+    candidateStarts.push(candidate)
+    if (candidateStarts.length >= MAX_CANDIDATE_STARTS) {
+      break
     }
   }
 
   const durationMs = sessionMinutes * 60 * 1000
-  const blockIntent = goalId ? 'goal.focus' : 'focus.block'
+  const blockIntent = goalId ? GOAL_BLOCK_INTENT : DEFAULT_BLOCK_INTENT
+  const receiptsBase = {
+    cadence: cadenceProfile?.cadence ?? 'none',
+    session_minutes: sessionMinutes,
+    conflict_checked: true,
+    timezone: cadenceProfile?.timezone ?? Intl.DateTimeFormat().resolvedOptions().timeZone,
+    goal_context: goalId ?? null,
+  }
 
   for (const candidate of candidateStarts) {
-    const end = new Date(candidate.getTime() + durationMs)
-    if (hasConflict(candidate, end, existing)) {
+    const startMs = candidate.getTime()
+    const endMs = startMs + durationMs
+    if (hasConflict(startMs, endMs, busy)) {
       continue
     }
-
-    const receipts = {
-      cadence: cadenceProfile?.cadence ?? 'none',
-      session_minutes: sessionMinutes,
-      conflict_checked: true,
-      timezone: cadenceProfile?.timezone ?? Intl.DateTimeFormat().resolvedOptions().timeZone,
-      goal_context: goalId ?? null,
-    }
+    const end = new Date(endMs)
 
     suggestions.push({
       start: toISOString(candidate),
       end: toISOString(end),
       intent: blockIntent,
       goal_id: goalId ?? null,
-      receipts,
+      receipts: { ...receiptsBase },
     })
 
     if (suggestions.length >= 3) {
@@ -0,0 +1,66 @@
+/**
+ * Bounded least-recently-used cache. Map preserves insertion order, so
+ * re-inserting a key on access moves it to the tail and the head is always
+ * the least recently used entry to evict.
+ */
+export class LruCache<K, V> {
+  private readonly entries = new Map<K, V>();
+  private readonly capacity: number;
+
+  constructor(capacity: number) {
+    this.capacity = Math.max(1, capacity);
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  /** Returns the cached value and marks it most recently used. */
+  get(key: K): V | undefined {
+    if (!this.entries.has(key)) return undefined;
+    const value = this.entries.get(key) as V;
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    return value;
+  }
+
+  /** Returns the cached value without touching its recency. */
+  peek(key: K): V | undefined {
+    return this.entries.get(key);
+  }
+
+  set(key: K, value: V): void {
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    if (this.entries.size > this.capacity) {
+      const oldest = this.entries.keys().next();
+      if (!oldest.done) {
+        this.entries.delete(oldest.value);
+      }
+    }
+  }
+
+  delete(key: K): boolean {
+    return this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
+
+/**
+ * Wraps a pure single-argument function with an LRU of its results. Only
+ * suitable when the result is immutable (strings, numbers, frozen objects)
+ * or callers copy it, since every hit returns the same value.
+ */
+export function memoize<K, V>(fn: (input: K) => V, capacity: number): (input: K) => V {
+  const cache = new LruCache<K, V>(capacity);
+  return (input: K): V => {
+    const hit = cache.get(input);
+    if (hit !== undefined) return hit;
+    const result = fn(input);
+    cache.set(input, result);
+    return result;
+  };
+}
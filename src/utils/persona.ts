@@ -2,63 +2,60 @@ import type {
   LanguageIntensity,
   PersonalizationState,
   PersonaTag,
-  ReflectionCadence,
 } from '../types/personalization'
 
-const isHigh = (value: number) => value >= 7
+const ARCHITECT_INTENSITIES: ReadonlySet<LanguageIntensity> = new Set<LanguageIntensity>([
+  'direct',
+])
+const EXPLORER_INTENSITIES: ReadonlySet<LanguageIntensity> = new Set<LanguageIntensity>([
+  'soft',
+  'neutral',
+])
+const ACCELERATOR_GOALS: ReadonlySet<string> = new Set(['execution', 'performance'])
 
-const hasGoals = (goals: string[], targets: string[]) =>
-  goals.some((goal) => targets.includes(goal))
+const HIGH_SCORE = 7
+const LOWER_BLUNTNESS = 4
 
-const cadenceIs = (cadence: ReflectionCadence, target: ReflectionCadence) =>
-  cadence === target
-
-const intensityMatches = (intensity: LanguageIntensity, targets: LanguageIntensity[]) =>
-  targets.includes(intensity)
-
-const hasDriftAnchor = (state: PersonalizationState) =>
-  state.drift_rule.enabled && Boolean(state.drift_rule.after)
-
-const hasCrisisNote = (state: PersonalizationState) => Boolean(state.crisis_card?.trim())
-
-const isLowerBluntness = (value: number) => value <= 4
+const hasAnyGoal = (goals: string[], targets: ReadonlySet<string>) => {
+  for (const goal of goals) {
+    if (targets.has(goal)) return true
+  }
+  return false
+}
 
 export const computePersonaTag = (state: PersonalizationState): PersonaTag => {
-  const visualScore = state.learning_style.visual
-  const kinestheticScore = state.learning_style.kinesthetic
-  const auditoryScore = state.learning_style.auditory
-  const bluntness = state.bluntness
-  const cadence = state.cadence
-  const intensity = state.language_intensity
-  const goals = state.goals
-  const sessionLength = state.session_length_minutes
+  const { visual, kinesthetic, auditory } = state.learning_style
+  const { bluntness, cadence, language_intensity: intensity } = state
 
   if (
-    isHigh(visualScore) &&
-    isHigh(kinestheticScore) &&
-    intensityMatches(intensity, ['direct']) &&
-    cadenceIs(cadence, 'daily')
+    visual >= HIGH_SCORE &&
+    kinesthetic >= HIGH_SCORE &&
+    ARCHITECT_INTENSITIES.has(intensity) &&
+    cadence === 'daily'
   ) {
     return 'Architect'
   }
 
-  if (
-    isHigh(auditoryScore) &&
-    intensityMatches(intensity, ['soft', 'neutral']) &&
-    cadenceIs(cadence, 'weekly')
-  ) {
+  if (auditory >= HIGH_SCORE && EXPLORER_INTENSITIES.has(intensity) && cadence === 'weekly') {
     return 'Explorer'
   }
 
-  if (hasDriftAnchor(state) && hasCrisisNote(state) && isLowerBluntness(bluntness)) {
+  const driftRule = state.drift_rule
+  if (
+    driftRule.enabled &&
+    Boolean(driftRule.after) &&
+    Boolean(state.crisis_card?.trim()) &&
+    bluntness <= LOWER_BLUNTNESS
+  ) {
     return 'Anchor'
   }
 
+  const sessionLength = state.session_length_minutes
   if (
     bluntness >= 8 &&
     sessionLength >= 10 &&
     sessionLength <= 25 &&
-    hasGoals(goals, ['execution', 'performance'])
+    hasAnyGoal(state.goals, ACCELERATOR_GOALS)
   ) {
     return 'Accelerator'
   }
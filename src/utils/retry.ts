@@ -3,6 +3,7 @@ export interface RetryOptions {
   baseDelayMs?: number;
   maxDelayMs?: number;
   jitter?: boolean;
+  shouldRetry?: (error: unknown) => boolean;
   onRetry?: (attempt: number, error: unknown) => void;
   wait?: (delay: number) => Promise<void>;
 }
@@ -19,6 +20,7 @@ export async function retryWithBackoff<T>(
     baseDelayMs = 300,
     maxDelayMs = 3000,
     jitter = true,
+    shouldRetry,
     onRetry,
     wait = defaultWait,
   } = options;
@@ -31,7 +33,7 @@ export async function retryWithBackoff<T>(
       return await task();
     } catch (error) {
       lastError = error;
-      if (attempt === retries) {
+      if (attempt === retries || (shouldRetry && !shouldRetry(error))) {
         break;
       }
 
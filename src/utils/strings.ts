@@ -1,25 +1,52 @@
+import { memoize as memoizeLru } from './lru';
+
 const WORD_BOUNDARY = /[A-Z]{2,}(?=[A-Z][a-z]+[0-9]*|\b)|[A-Z]?[a-z]+[0-9]*|[A-Z]+|[0-9]+/g;
+const TITLE_SEPARATOR = /[_\s]+/;
 
-export function toSnakeCase(input: string): string {
-  if (!input) return '';
+// Inputs are mostly intent labels and short slot titles, a low-cardinality
+// set, so each converter memoizes its results in a small LRU.
+const MEMO_CAPACITY = 256;
+
+const memoize = (convert: (input: string) => string): ((input: string) => string) =>
+  memoizeLru(convert, MEMO_CAPACITY);
+
+const capitalizeParts = (input: string): string[] => {
+  const parts = input.split(TITLE_SEPARATOR);
+  const output: string[] = [];
+  for (const part of parts) {
+    if (part) {
+      output.push(part.charAt(0).toUpperCase() + part.slice(1).toLowerCase());
+    }
+  }
+  return output;
+};
+
+const snakeCase = memoize((input: string): string => {
   const trimmed = input.trim();
   const matches = trimmed.match(WORD_BOUNDARY);
   if (!matches) {
     return trimmed.toLowerCase().replace(/\s+/g, '_');
   }
   return matches.map((word) => word.toLowerCase()).join('_');
+});
+
+const titleCase = memoize((input: string): string => capitalizeParts(input).join(' '));
+
+// Joins the capitalized parts directly instead of title-casing and then
+// stripping whitespace with a second regex.
+const pascalCase = memoize((input: string): string => capitalizeParts(input).join(''));
+
+export function toSnakeCase(input: string): string {
+  if (!input) return '';
+  return snakeCase(input);
 }
 
 export function toTitleCase(input: string): string {
   if (!input) return '';
-  return input
-    .split(/[_\s]+/)
-    .filter(Boolean)
-    .map((part) => part.charAt(0).toUpperCase() + part.slice(1).toLowerCase())
-    .join(' ');
+  return titleCase(input);
 }
 
 export function toPascalCase(input: string): string {
   if (!input) return '';
-  return toTitleCase(input).replace(/\s+/g, '');
+  return pascalCase(input);
 }
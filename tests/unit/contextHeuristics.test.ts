@@ -82,4 +82,28 @@ describe("context heuristics", () => {
     const likelyNeed = inferLikelyNeed("feeling tired again", modes[0]?.label ?? null, evidence[0]?.text ?? null);
     expect(likelyNeed).toBe("energy_check");
   });
+
+  it("keeps the strongest 20 evidence nodes with deduplicated sources", () => {
+    const nodes = Array.from({ length: 25 }, (_, index) => ({
+      id: `node-${index}`,
+      type: "topic" as const,
+      text: `topic ${index}`,
+      trust_weight: 0.5 + index / 100,
+      sentiment: null,
+    }));
+    const neighborNodes = new Map(nodes.map((node) => [node.id, node]));
+    const edges: MemoryEdgeInput[] = nodes.slice(1).flatMap((node) => [
+      { src_id: "node-0", dst_id: node.id, relation: "mentions", weight: 1 },
+      { src_id: "node-0", dst_id: node.id, relation: "mentions", weight: 1 },
+    ]);
+
+    const evidence = buildEvidence([], edges, neighborNodes, [], 0.4);
+
+    expect(evidence).toHaveLength(20);
+    expect(evidence[0]?.id).toBe("node-24");
+    expect(evidence.map((item) => item.strength)).toEqual(
+      [...evidence.map((item) => item.strength)].sort((a, b) => b - a)
+    );
+    expect(evidence[0]?.sources).toEqual(["edge:mentions"]);
+  });
 });
@@ -1,5 +1,5 @@
 import { describe, it, expect, vi } from 'vitest';
-import { embedText, generateEmbedding } from '@/agent/embeddings';
+import { embedText, embedTextBatch, generateEmbedding } from '@/agent/embeddings';
 
 vi.mock('@/lib/supabase');
 
@@ -9,6 +9,31 @@ describe('Embeddings', () => {
       const result = await embedText('test');
       expect(Array.isArray(result)).toBe(true);
     });
+
+    it('should return a deterministic unit-length fallback vector', async () => {
+      const first = await embedText('hello riflett');
+      const second = await embedText('hello riflett');
+      expect(first).toHaveLength(384);
+      expect(second).toEqual(first);
+      const norm = Math.sqrt(first.reduce((sum, val) => sum + val * val, 0));
+      expect(norm).toBeCloseTo(1, 6);
+    });
+
+    it('should not let callers mutate cached vectors', async () => {
+      const first = await embedText('cached snippet');
+      const expected = first.slice();
+      first.fill(0);
+      expect(await embedText('cached snippet')).toEqual(expected);
+    });
+  });
+
+  describe('embedTextBatch', () => {
+    it('should match per-text embeddings in input order', async () => {
+      const texts = ['first snippet', '', 'second snippet'];
+      const batch = await embedTextBatch(texts);
+      const single = await Promise.all(texts.map((text) => embedText(text)));
+      expect(batch).toEqual(single);
+    });
   });
 
   describe('generateEmbedding', () => {
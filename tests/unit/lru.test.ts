@@ -0,0 +1,38 @@
+import { describe, expect, it, vi } from "vitest";
+import { LruCache, memoize } from "@/utils/lru";
+
+describe("LruCache", () => {
+  it("evicts the least recently used entry once over capacity", () => {
+    const cache = new LruCache<string, number>(2);
+    cache.set("a", 1);
+    cache.set("b", 2);
+    expect(cache.get("a")).toBe(1);
+    cache.set("c", 3);
+
+    expect(cache.get("b")).toBeUndefined();
+    expect(cache.get("a")).toBe(1);
+    expect(cache.get("c")).toBe(3);
+    expect(cache.size).toBe(2);
+  });
+
+  it("peek does not refresh recency", () => {
+    const cache = new LruCache<string, number>(2);
+    cache.set("a", 1);
+    cache.set("b", 2);
+    expect(cache.peek("a")).toBe(1);
+    cache.set("c", 3);
+
+    expect(cache.peek("a")).toBeUndefined();
+  });
+});
+
+describe("memoize", () => {
+  it("calls the wrapped function once per distinct input", () => {
+    const convert = vi.fn((input: string) => input.toUpperCase());
+    const cached = memoize(convert, 4);
+
+    expect(cached("a")).toBe("A");
+    expect(cached("a")).toBe("A");
+    expect(convert).toHaveBeenCalledTimes(1);
+  });
+});
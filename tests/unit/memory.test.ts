@@ -1,6 +1,7 @@
 import { describe, it, expect, vi, beforeEach } from 'vitest';
 import { Memory } from '@/agent/memory';
 import { getOperatingPicture } from '@/services/memory';
+import { embedText, embedTextBatch } from '@/agent/embeddings';
 
 // Mock dependencies
 vi.mock('@/lib/supabase');
@@ -10,6 +11,11 @@ vi.mock('@/services/memory');
 describe('Memory', () => {
   beforeEach(() => {
     vi.clearAllMocks();
+    // Mirror the real contract: one vector per text, never rejects.
+    vi.mocked(embedText).mockResolvedValue([1, 0, 0]);
+    vi.mocked(embedTextBatch).mockImplementation(async (texts: string[]) =>
+      texts.map(() => [1, 0, 0])
+    );
   });
 
   describe('searchTopN', () => {
@@ -36,6 +42,20 @@ describe('Memory', () => {
     });
   });
 
+  describe('searchTopNBatch', () => {
+    it('should return one result list per query in input order', async () => {
+      const result = await Memory.searchTopNBatch({
+        queries: ['alpha', 'beta', 'alpha'],
+        kinds: ['entry'],
+        topK: 3,
+      });
+      expect(result).toHaveLength(3);
+      expect(result.every((records) => Array.isArray(records))).toBe(true);
+      expect(result[2]).toEqual(result[0]);
+      expect(result[2]).not.toBe(result[0]);
+    });
+  });
+
   describe('getBrief', () => {
     it('should get operating picture and rag', async () => {
       vi.mocked(getOperatingPicture).mockResolvedValue({
@@ -68,4 +68,18 @@ describe("Outbox.queue", () => {
     expect(remaining.find((job) => job.id === target.id)).toBeUndefined();
     expect(remaining).toHaveLength(rest.length + 1);
   });
+
+  it("coalesces concurrent writes and persists the final state", async () => {
+    const { Outbox } = await import("@/agent/outbox");
+
+    await Promise.all(
+      Array.from({ length: 10 }, (_, index) =>
+        Outbox.queue({ kind: "polish", payload: { index } })
+      )
+    );
+
+    expect(asyncStorageMock.setItem.mock.calls.length).toBeLessThan(10);
+    const stored = JSON.parse(store.get("riflett_outbox_v1") ?? "[]");
+    expect(stored).toHaveLength(10);
+  });
 });
@@ -0,0 +1,24 @@
+import { describe, it, expect } from 'vitest';
+import { createPhraseMatcher } from '@/agent/utils/phraseMatcher';
+
+describe('createPhraseMatcher', () => {
+  const groups = [
+    [1, ['he', 'she', 'hers']],
+    [2, ['his']],
+    [4, ['just now', 'now']],
+  ] as const;
+  const matcher = createPhraseMatcher(groups);
+
+  const expected = (text: string): number =>
+    groups.reduce(
+      (bits, [bit, phrases]) =>
+        phrases.some((phrase) => text.includes(phrase)) ? bits | bit : bits,
+      0
+    );
+
+  it('reports every group with a substring match, including overlaps', () => {
+    for (const text of ['ushers', 'this is just now', 'nothing', 'shis', 'know', '']) {
+      expect(matcher.scan(text)).toBe(expected(text));
+    }
+  });
+});
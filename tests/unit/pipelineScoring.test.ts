@@ -23,4 +23,17 @@ describe('scoreContextRecords', () => {
     expect(records[1]?.id).toBe('entry-1');
     expect(records[0]?.scoring.priority).toBeGreaterThan(records[2]?.scoring.priority ?? 0);
   });
+
+  it('scores time of day once per call and tolerates invalid time zones', () => {
+    const now = Date.now();
+    const [utc] = scoreContextRecords([createRecord('entry-1', 'entry', now, 0.5)], {
+      userTimeZone: 'UTC',
+    });
+    expect(utc?.scoring.timeOfDay).toBe(1);
+
+    const [invalid] = scoreContextRecords([createRecord('entry-1', 'entry', now, 0.5)], {
+      userTimeZone: 'Not/AZone',
+    });
+    expect(invalid?.scoring.timeOfDay).toBe(0.5);
+  });
 });
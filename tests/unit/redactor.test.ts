@@ -22,5 +22,12 @@ describe('Redactor', () => {
       expect(result.masked).toContain('123-456');
       expect(Object.keys(result.replacementMap)).not.toContain('[CARD_0]');
     });
+
+    it('numbers each kind independently in a single pass', () => {
+      const text = 'Mail a@b.co or c@d.io, call (555) 123-4567, visit 12 Elm Street';
+      const result = Redactor.mask(text);
+      expect(result.masked).toBe('Mail [EMAIL_0] or [EMAIL_1], call [PHONE_0], visit [ADDR_0]');
+      expect(Redactor.unmask(result.masked, result.replacementMap)).toBe(text);
+    });
   });
 });
@@ -38,4 +38,22 @@ describe("retryWithBackoff", () => {
     expect(result).toBe("ok");
     expect(wait).toHaveBeenCalledTimes(2);
   });
+
+  it("stops early when shouldRetry rejects the error", async () => {
+    const wait = vi.fn().mockResolvedValue(undefined);
+    let attempts = 0;
+
+    await expect(
+      retryWithBackoff(
+        async () => {
+          attempts += 1;
+          throw new Error("unauthorized");
+        },
+        { retries: 3, wait, shouldRetry: () => false }
+      )
+    ).rejects.toThrow("unauthorized");
+
+    expect(attempts).toBe(1);
+    expect(wait).not.toHaveBeenCalled();
+  });
 });
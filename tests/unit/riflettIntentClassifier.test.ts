@@ -9,5 +9,13 @@ describe('RiflettIntentClassifier', () => {
       expect(result).toHaveProperty('label');
       expect(result).toHaveProperty('confidence');
     });
+
+    it('returns equal but independent results for repeated messages', () => {
+      const first = classifyRiflettIntent({ text: 'thanks', contextRecords: [] });
+      first.reasons.push('mutated');
+      const second = classifyRiflettIntent({ text: 'thanks', contextRecords: [] });
+      expect(second.reasons).not.toContain('mutated');
+      expect(second.label).toBe(first.label);
+    });
   });
 });
@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { toSnakeCase, toPascalCase } from '@/utils/strings';
+import { toSnakeCase, toPascalCase, toTitleCase } from '@/utils/strings';
 
 describe('Strings', () => {
   describe('toSnakeCase', () => {
@@ -8,6 +8,13 @@ describe('Strings', () => {
     });
   });
 
+  describe('toTitleCase', () => {
+    it('should title-case words split on underscores and whitespace', () => {
+      expect(toTitleCase('entry_create')).toBe('Entry Create');
+      expect(toTitleCase('  weekly   PLANNING_review ')).toBe('Weekly Planning Review');
+    });
+  });
+
   describe('toPascalCase', () => {
     it('should convert to pascal case', () => {
       expect(toPascalCase('hello_world')).toBe('HelloWorld');
@@ -47,4 +47,15 @@ describe('UserConfig', () => {
 
     unsubscribe();
   });
+
+  it('shares one frozen snapshot until the config changes', async () => {
+    const first = await UserConfig.snapshot();
+    expect(await UserConfig.snapshot()).toBe(first);
+    expect(Object.isFrozen(first)).toBe(true);
+
+    await UserConfig.update({ bluntness: 3 });
+    const next = await UserConfig.snapshot();
+    expect(next).not.toBe(first);
+    expect(next.bluntness).toBe(3);
+  });
 });